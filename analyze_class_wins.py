@@ -6,28 +6,103 @@ This will inform a new class-specific Matchup Score formula.
 """
 
 import asyncio
-from collections import defaultdict
-from statistics import mean, stdev
-
-async def analyze():
-    from app.feed import get_feed
-
-    feed = await get_feed()
-    store = feed.store
-
-    print(f"\n{'='*70}")
-    print("CLASS-SPECIFIC WIN FACTOR ANALYSIS")
-    print(f"{'='*70}")
-    print(f"Total scored matches: {len(store.scored_matches)}")
-
-    # Collect data per class
-    # Structure: {class: [{won, win_type, own_elims, opp_elims, own_deps, opp_deps, ...}, ...]}
-    class_games = defaultdict(list)
-
-    # Also track win_type distribution
-    win_type_by_class = defaultdict(lambda: defaultdict(int))
-
+import sqlite3
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import numpy as np
+
+# Derived feature rows are cached here so reruns only flatten matches that
+# were not seen before (the store is append-only for scored matches).
+CACHE_DB_PATH = Path(__file__).parent / "grandarena.db"
+
+CACHE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS champion_game_features_cache (
+        match_id TEXT,
+        champ_token INTEGER,
+        champ_class TEXT,
+        opp_class TEXT,
+        won INTEGER,
+        win_type TEXT,
+        my_elims REAL,
+        my_deps REAL,
+        my_wart REAL,
+        own_supp_elims REAL,
+        own_supp_deps REAL,
+        opp_supp_elims REAL,
+        opp_supp_deps REAL,
+        elim_diff REAL,
+        dep_diff REAL,
+        PRIMARY KEY (match_id, champ_token)
+    )
+'''
+
+# Shared bucket edges for the differential analyses: (-inf,-0.3), [-0.3,-0.1),
+# [-0.1,0.1), [0.1,0.3), [0.3,inf)
+DIFF_BUCKET_EDGES = np.array([-0.3, -0.1, 0.1, 0.3])
+DIFF_BUCKET_LABELS = [
+    "Very Low (-inf to -0.3)",
+    "Low (-0.3 to -0.1)",
+    "Even (-0.1 to +0.1)",
+    "High (+0.1 to +0.3)",
+    "Very High (+0.3 to +inf)",
+]
+
+
+def bucket_win_rates(diffs, won):
+    """Assign each game to a differential bucket and count wins per bucket.
+
+    One searchsorted + two bincounts instead of a Python filter per bucket.
+    Returns (wins, totals) arrays of length len(DIFF_BUCKET_LABELS).
+    """
+    bucket = np.searchsorted(DIFF_BUCKET_EDGES, diffs, side="right")
+    totals = np.bincount(bucket, minlength=5)
+    wins = np.bincount(bucket, weights=won, minlength=5)
+    return wins, totals
+
+
+def collect_game_features(store):
+    """Flatten scored matches into per-(match, champion) feature rows.
+
+    Incremental: derived rows are persisted to champion_game_features_cache
+    keyed by (match_id, champ_token), so only matches not yet cached get
+    flattened; the analyses always read from the full cache.
+
+    Returns (class_games, win_type_by_class), where class_games maps
+    class -> dict of numpy column arrays (SoA layout): the analyses run as
+    boolean-mask vector ops instead of per-dict filtering.
+    """
+    conn = sqlite3.connect(str(CACHE_DB_PATH))
+    # Same tuning as analysis.py: mmap + big page cache for the full-cache
+    # read-back, WAL + relaxed fsync for the bulk insert.
+    conn.executescript('''
+        PRAGMA mmap_size=30000000000;
+        PRAGMA cache_size=-262144;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+    ''')
+    conn.execute(CACHE_SCHEMA)
+    cached_ids = {
+        row[0]
+        for row in conn.execute("SELECT DISTINCT match_id FROM champion_game_features_cache")
+    }
+
+    # Batch-load every token's career averages into one contiguous table up
+    # front: row 0 holds the store defaults for unknown tokens, so supporter
+    # lookups are a dict probe + fancy-index instead of a method call.
+    tok_index: dict[int, int] = {}
+    career_rows = [(1.0, 1.5)]
+    for tid, stats in store.cumulative_stats.items():
+        tok_index[tid] = len(career_rows)
+        career_rows.append((stats["avg_elims"], stats["avg_deps"]))
+    career_table = np.asarray(career_rows, dtype=np.float64)
+
+    new_rows = []
     for match_id in store.scored_matches:
+        if match_id in cached_ids:
+            continue
         match = store.matches.get(match_id)
         if not match or not match.team_won:
             continue
@@ -47,8 +122,11 @@ async def analyze():
         if len(champions) != 2:
             continue
 
-        # Get performance data
-        perf_map = {p["token_id"]: p for p in match.performances if p.get("token_id")}
+        # Get performance data (cached on the match record)
+        perf_map = match.perf_map
+
+        # Index champions by team once; no per-champion list scan below
+        champion_by_team = {c["team"]: c for c in champions}
 
         # Analyze from each champion's perspective
         for champ in champions:
@@ -58,7 +136,7 @@ async def analyze():
             won = match.team_won == team
 
             # Find opponent
-            opp = [c for c in champions if c["team"] != team][0]
+            opp = champion_by_team[2 if team == 1 else 1]
             opp_class = opp.get("class", "Unknown")
             opp_team = opp.get("team")
 
@@ -73,51 +151,123 @@ async def analyze():
             opp_elims = opp_perf.get("eliminations", 0) or 0
             opp_deps = opp_perf.get("deposits", 0) or 0
 
-            # Get supporter stats (from career averages)
-            own_supp_elims = []
-            own_supp_deps = []
-            for s in supporters_by_team.get(team, []):
-                s_id = s.get("token_id")
-                if s_id:
-                    stats = store.get_career_stats(s_id)
-                    own_supp_elims.append(stats["career_elims"])
-                    own_supp_deps.append(stats["career_deps"])
-
-            opp_supp_elims = []
-            opp_supp_deps = []
-            for s in supporters_by_team.get(opp_team, []):
-                s_id = s.get("token_id")
-                if s_id:
-                    stats = store.get_career_stats(s_id)
-                    opp_supp_elims.append(stats["career_elims"])
-                    opp_supp_deps.append(stats["career_deps"])
-
-            own_avg_elims = mean(own_supp_elims) if own_supp_elims else 1.0
-            own_avg_deps = mean(own_supp_deps) if own_supp_deps else 1.5
-            opp_avg_elims = mean(opp_supp_elims) if opp_supp_elims else 1.0
-            opp_avg_deps = mean(opp_supp_deps) if opp_supp_deps else 1.5
-
-            class_games[champ_class].append({
-                "won": won,
-                "win_type": match.win_type,
-                "opp_class": opp_class,
-                # Champion's own stats (actual game performance)
-                "my_elims": my_elims,
-                "my_deps": my_deps,
-                "my_wart": my_wart,
-                # Supporter averages
-                "own_supp_elims": own_avg_elims,
-                "own_supp_deps": own_avg_deps,
-                "opp_supp_elims": opp_avg_elims,
-                "opp_supp_deps": opp_avg_deps,
-                # Differentials
-                "elim_diff": own_avg_elims - opp_avg_elims,
-                "dep_diff": own_avg_deps - opp_avg_deps,
-            })
-
-            # Track win type when this class WINS
-            if won:
-                win_type_by_class[champ_class][match.win_type] += 1
+            # Supporter career averages via the precomputed table (row 0 =
+            # defaults for tokens without cumulative stats)
+            own_idx = [
+                tok_index.get(s["token_id"], 0)
+                for s in supporters_by_team.get(team, [])
+                if s.get("token_id")
+            ]
+            opp_idx = [
+                tok_index.get(s["token_id"], 0)
+                for s in supporters_by_team.get(opp_team, [])
+                if s.get("token_id")
+            ]
+
+            if own_idx:
+                own_avg_elims, own_avg_deps = career_table[own_idx].mean(axis=0)
+            else:
+                own_avg_elims, own_avg_deps = 1.0, 1.5
+            if opp_idx:
+                opp_avg_elims, opp_avg_deps = career_table[opp_idx].mean(axis=0)
+            else:
+                opp_avg_elims, opp_avg_deps = 1.0, 1.5
+
+            new_rows.append((
+                match_id, token_id, champ_class, opp_class, int(won),
+                match.win_type, my_elims, my_deps, my_wart,
+                own_avg_elims, own_avg_deps, opp_avg_elims, opp_avg_deps,
+                own_avg_elims - opp_avg_elims, own_avg_deps - opp_avg_deps,
+            ))
+
+    if new_rows:
+        conn.executemany(
+            "INSERT OR IGNORE INTO champion_game_features_cache "
+            "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+            new_rows,
+        )
+        conn.commit()
+
+    # Build the SoA columns and win_type distribution from the full cache
+    class_cols = defaultdict(lambda: {
+        "won": [],
+        "opp_class": [],
+        # Champion's own stats (actual game performance)
+        "my_elims": [],
+        "my_deps": [],
+        "my_wart": [],
+        # Supporter averages
+        "own_supp_elims": [],
+        "own_supp_deps": [],
+        "opp_supp_elims": [],
+        "opp_supp_deps": [],
+        # Differentials
+        "elim_diff": [],
+        "dep_diff": [],
+    })
+    for (_, _, champ_class, opp_class, won, win_type, my_elims, my_deps,
+         my_wart, own_supp_elims, own_supp_deps, opp_supp_elims,
+         opp_supp_deps, elim_diff, dep_diff) in conn.execute(
+            "SELECT * FROM champion_game_features_cache"):
+        cols = class_cols[champ_class]
+        cols["won"].append(bool(won))
+        cols["opp_class"].append(opp_class)
+        cols["my_elims"].append(my_elims)
+        cols["my_deps"].append(my_deps)
+        cols["my_wart"].append(my_wart)
+        cols["own_supp_elims"].append(own_supp_elims)
+        cols["own_supp_deps"].append(own_supp_deps)
+        cols["opp_supp_elims"].append(opp_supp_elims)
+        cols["opp_supp_deps"].append(opp_supp_deps)
+        cols["elim_diff"].append(elim_diff)
+        cols["dep_diff"].append(dep_diff)
+
+    # Win-type distribution as a flat Counter keyed by (class, win_type) -
+    # one hash lookup per access instead of two nested dict probes
+    win_type_counts = Counter({
+        (champ_class, win_type): count
+        for champ_class, win_type, count in conn.execute(
+            "SELECT champ_class, win_type, COUNT(*) FROM champion_game_features_cache "
+            "WHERE won = 1 GROUP BY champ_class, win_type"
+        )
+    })
+
+    # Class-vs-class matchup matrix as one SQL rollup (analysis 5); the
+    # small-sample cutoff is applied in the HAVING clause so cells that
+    # would print as "--" are never transferred
+    matchups = {
+        (champ_class, opp_class): {"wins": int(wins), "games": int(games)}
+        for champ_class, opp_class, games, wins in conn.execute(
+            "SELECT champ_class, opp_class, COUNT(*), SUM(won) "
+            "FROM champion_game_features_cache "
+            "GROUP BY champ_class, opp_class HAVING COUNT(*) >= 10"
+        )
+    }
+
+    conn.close()
+
+    class_games = {
+        cls: {
+            key: np.asarray(values, dtype=bool if key == "won" else None)
+            for key, values in cols.items()
+        }
+        for cls, cols in class_cols.items()
+    }
+    return class_games, win_type_counts, matchups
+
+
+async def analyze():
+    from app.feed import get_feed
+
+    feed = await get_feed()
+    store = feed.store
+
+    print(f"\n{'='*70}")
+    print("CLASS-SPECIFIC WIN FACTOR ANALYSIS")
+    print(f"{'='*70}")
+    print(f"Total scored matches: {len(store.scored_matches)}")
+
+    class_games, win_type_counts, matchups = collect_game_features(store)
 
     # ==========================================
     # ANALYSIS 1: How Each Class Wins
@@ -127,12 +277,15 @@ async def analyze():
     print(f"{'='*70}")
     print("\nWhen this class WINS, what's the win_type?\n")
 
-    for cls in sorted(win_type_by_class.keys()):
-        wins = win_type_by_class[cls]
-        total = sum(wins.values())
+    win_totals = Counter()
+    for (cls, _), count in win_type_counts.items():
+        win_totals[cls] += count
+
+    for cls in sorted(win_totals.keys()):
+        total = win_totals[cls]
         print(f"\n{cls} ({total} wins):")
         for wt in ["eliminations", "gacha", "deposits"]:
-            count = wins.get(wt, 0)
+            count = win_type_counts.get((cls, wt), 0)
             pct = 100 * count / total if total > 0 else 0
             bar = "#" * int(pct / 2)
             print(f"  {wt:12}: {count:4} ({pct:5.1f}%) {bar}")
@@ -145,28 +298,41 @@ async def analyze():
     print(f"{'='*70}")
     print("\nDoes having better supporter elims/deps correlate with winning?\n")
 
+    # Signed impact deltas per class, reused by analysis 6 so the win/loss
+    # means are not recomputed there
+    impact_by_class = {}
+
     for cls in sorted(class_games.keys()):
-        games = class_games[cls]
-        if len(games) < 50:
+        cols = class_games[cls]
+        won = cols["won"]
+        n_games = won.size
+        if n_games < 50:
             continue
 
         # Split by outcome
-        wins = [g for g in games if g["won"]]
-        losses = [g for g in games if not g["won"]]
+        n_wins = int(won.sum())
+        n_losses = n_games - n_wins
 
-        if not wins or not losses:
+        if not n_wins or not n_losses:
             continue
 
-        win_rate = 100 * len(wins) / len(games)
+        win_rate = 100 * n_wins / n_games
 
         # Calculate averages for wins vs losses
-        win_elim_diff = mean([g["elim_diff"] for g in wins])
-        loss_elim_diff = mean([g["elim_diff"] for g in losses])
+        win_elim_diff = cols["elim_diff"][won].mean()
+        loss_elim_diff = cols["elim_diff"][~won].mean()
 
-        win_dep_diff = mean([g["dep_diff"] for g in wins])
-        loss_dep_diff = mean([g["dep_diff"] for g in losses])
+        win_dep_diff = cols["dep_diff"][won].mean()
+        loss_dep_diff = cols["dep_diff"][~won].mean()
 
-        print(f"\n{cls} (Win Rate: {win_rate:.1f}%, {len(games)} games)")
+        impact_by_class[cls] = {
+            "elim_impact": win_elim_diff - loss_elim_diff,
+            "dep_impact": win_dep_diff - loss_dep_diff,
+            "n_wins": n_wins,
+            "n_games": n_games,
+        }
+
+        print(f"\n{cls} (Win Rate: {win_rate:.1f}%, {n_games} games)")
         print(f"  Supporter Elim Diff:  Win avg={win_elim_diff:+.3f}  Loss avg={loss_elim_diff:+.3f}  Delta={win_elim_diff-loss_elim_diff:+.3f}")
         print(f"  Supporter Dep Diff:   Win avg={win_dep_diff:+.3f}  Loss avg={loss_dep_diff:+.3f}  Delta={win_dep_diff-loss_dep_diff:+.3f}")
 
@@ -189,28 +355,36 @@ async def analyze():
     print(f"{'='*70}")
     print("\nDoes positive elim diff = higher win rate? (Varies by class)\n")
 
-    elim_buckets = [
-        ("Very Low (-inf to -0.3)", -999, -0.3),
-        ("Low (-0.3 to -0.1)", -0.3, -0.1),
-        ("Even (-0.1 to +0.1)", -0.1, 0.1),
-        ("High (+0.1 to +0.3)", 0.1, 0.3),
-        ("Very High (+0.3 to +inf)", 0.3, 999),
-    ]
+    # Analyses 3 and 4 share the same per-class traversal, so compute both
+    # bucketings while the class columns are hot and buffer the dep table
+    # until its header prints below.
+    def format_bucket_table(wins, totals):
+        lines = []
+        for bucket_name, bucket_wins, total in zip(DIFF_BUCKET_LABELS, wins, totals):
+            if total < 10:
+                continue
+            wr = 100 * bucket_wins / total
+            bar = "#" * int(wr / 2)
+            lines.append(f"  {bucket_name:25}: {wr:5.1f}% ({total:4} games) {bar}")
+        return lines
 
+    dep_report = []
     for cls in sorted(class_games.keys()):
-        games = class_games[cls]
-        if len(games) < 100:
+        cols = class_games[cls]
+        won = cols["won"]
+        if won.size < 100:
             continue
 
-        print(f"\n{cls}:")
-        for bucket_name, low, high in elim_buckets:
-            bucket_games = [g for g in games if low <= g["elim_diff"] < high]
-            if len(bucket_games) < 10:
-                continue
-            wins = sum(1 for g in bucket_games if g["won"])
-            wr = 100 * wins / len(bucket_games)
-            bar = "#" * int(wr / 2)
-            print(f"  {bucket_name:25}: {wr:5.1f}% ({len(bucket_games):4} games) {bar}")
+        elim_wins, elim_totals = bucket_win_rates(cols["elim_diff"], won)
+        dep_wins, dep_totals = bucket_win_rates(cols["dep_diff"], won)
+
+        sys.stdout.write(
+            f"\n{cls}:\n"
+            + "".join(line + "\n" for line in format_bucket_table(elim_wins, elim_totals))
+        )
+
+        dep_report.append(f"\n{cls}:")
+        dep_report.extend(format_bucket_table(dep_wins, dep_totals))
 
     # ==========================================
     # ANALYSIS 4: Win Rate by Dep Differential Bucket (Per Class)
@@ -220,28 +394,7 @@ async def analyze():
     print(f"{'='*70}")
     print("\nDoes positive dep diff = higher win rate? (Varies by class)\n")
 
-    dep_buckets = [
-        ("Very Low (-inf to -0.3)", -999, -0.3),
-        ("Low (-0.3 to -0.1)", -0.3, -0.1),
-        ("Even (-0.1 to +0.1)", -0.1, 0.1),
-        ("High (+0.1 to +0.3)", 0.1, 0.3),
-        ("Very High (+0.3 to +inf)", 0.3, 999),
-    ]
-
-    for cls in sorted(class_games.keys()):
-        games = class_games[cls]
-        if len(games) < 100:
-            continue
-
-        print(f"\n{cls}:")
-        for bucket_name, low, high in dep_buckets:
-            bucket_games = [g for g in games if low <= g["dep_diff"] < high]
-            if len(bucket_games) < 10:
-                continue
-            wins = sum(1 for g in bucket_games if g["won"])
-            wr = 100 * wins / len(bucket_games)
-            bar = "#" * int(wr / 2)
-            print(f"  {bucket_name:25}: {wr:5.1f}% ({len(bucket_games):4} games) {bar}")
+    sys.stdout.write("".join(line + "\n" for line in dep_report))
 
     # ==========================================
     # ANALYSIS 5: Class vs Class Matchup Matrix
@@ -252,35 +405,22 @@ async def analyze():
     print("\nRows = Your Class, Columns = Opponent Class")
     print("Value = Your Win Rate against that class\n")
 
-    # Build matchup data
-    matchups = defaultdict(lambda: {"wins": 0, "games": 0})
-    for cls, games in class_games.items():
-        for g in games:
-            opp = g["opp_class"]
-            matchups[(cls, opp)]["games"] += 1
-            if g["won"]:
-                matchups[(cls, opp)]["wins"] += 1
-
     # Get all classes
-    all_classes = sorted(set(c for c, _ in matchups.keys()))
-
-    # Print header
-    print(f"{'':12}", end="")
-    for opp in all_classes:
-        print(f" {opp[:6]:>6}", end="")
-    print()
+    all_classes = sorted(class_games.keys())
 
-    # Print matrix
+    # Build the whole matrix as one buffer and write it in a single call
+    matrix_lines = [f"{'':12}" + "".join(f" {opp[:6]:>6}" for opp in all_classes)]
     for cls in all_classes:
-        print(f"{cls[:12]:12}", end="")
+        cells = [f"{cls[:12]:12}"]
         for opp in all_classes:
             data = matchups.get((cls, opp), {"wins": 0, "games": 0})
             if data["games"] >= 10:
                 wr = 100 * data["wins"] / data["games"]
-                print(f" {wr:5.0f}%", end="")
+                cells.append(f" {wr:5.0f}%")
             else:
-                print(f"    --", end="")
-        print()
+                cells.append("    --")
+        matrix_lines.append("".join(cells))
+    sys.stdout.write("\n".join(matrix_lines) + "\n")
 
     # ==========================================
     # ANALYSIS 6: Optimal Formula Coefficients
@@ -299,24 +439,16 @@ Where supporter_adj uses CLASS-SPECIFIC weights:
 
     class_recommendations = {}
     for cls in sorted(class_games.keys()):
-        games = class_games[cls]
-        if len(games) < 100:
-            continue
-
-        wins = [g for g in games if g["won"]]
-        losses = [g for g in games if not g["won"]]
-
-        if not wins or not losses:
+        # Reuse analysis 2's win/loss impact deltas (absent for classes with
+        # too few games or a one-sided record)
+        impact = impact_by_class.get(cls)
+        if impact is None or impact["n_games"] < 100:
             continue
 
-        # Calculate impact scores
-        win_elim_diff = mean([g["elim_diff"] for g in wins])
-        loss_elim_diff = mean([g["elim_diff"] for g in losses])
-        elim_impact = win_elim_diff - loss_elim_diff
-
-        win_dep_diff = mean([g["dep_diff"] for g in wins])
-        loss_dep_diff = mean([g["dep_diff"] for g in losses])
-        dep_impact = win_dep_diff - loss_dep_diff
+        n_wins = impact["n_wins"]
+        n_games = impact["n_games"]
+        elim_impact = impact["elim_impact"]
+        dep_impact = impact["dep_impact"]
 
         # Normalize to get relative weights
         total = abs(elim_impact) + abs(dep_impact)
@@ -328,17 +460,16 @@ Where supporter_adj uses CLASS-SPECIFIC weights:
             dep_weight = 0.5
 
         # Determine primary win condition from win_type
-        wins_dict = win_type_by_class[cls]
-        total_wins = sum(wins_dict.values())
-        elim_wins = wins_dict.get("eliminations", 0) / total_wins if total_wins else 0
-        gacha_wins = wins_dict.get("gacha", 0) / total_wins if total_wins else 0
-        dep_wins = wins_dict.get("deposits", 0) / total_wins if total_wins else 0
+        total_wins = win_totals.get(cls, 0)
+        elim_wins = win_type_counts.get((cls, "eliminations"), 0) / total_wins if total_wins else 0
+        gacha_wins = win_type_counts.get((cls, "gacha"), 0) / total_wins if total_wins else 0
+        dep_wins = win_type_counts.get((cls, "deposits"), 0) / total_wins if total_wins else 0
 
         class_recommendations[cls] = {
             "elim_weight": round(elim_weight, 2),
             "dep_weight": round(dep_weight, 2),
             "primary_win_type": max([("elims", elim_wins), ("gacha", gacha_wins), ("deps", dep_wins)], key=lambda x: x[1])[0],
-            "base_wr": round(100 * len(wins) / len(games), 1),
+            "base_wr": round(100 * n_wins / n_games, 1),
         }
 
         print(f"\n{cls} (base WR: {class_recommendations[cls]['base_wr']}%):")
@@ -12,9 +12,23 @@ Key questions:
 """
 
 import asyncio
+import hashlib
 import json
 from collections import defaultdict
-from statistics import mean, stdev, median
+from pathlib import Path
+
+import numpy as np
+
+# Flattened scored-match arrays are persisted here so repeated script runs
+# skip the full match traversal; the filename is keyed by the set of
+# scored match ids, so new data invalidates the cache automatically.
+FLAT_CACHE_DIR = Path.home() / ".cache" / "contesttool"
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
 
 # Fantasy scoring constants
 FP_ELIM = 80
@@ -23,6 +37,45 @@ FP_WART = 0.5625
 FP_WIN = 300
 
 
+def _class_moments_np(cls_id, fp, n_classes):
+    """NumPy fallback: per-class count/mean/M2 via bincount reductions."""
+    count = np.bincount(cls_id, minlength=n_classes)
+    sums = np.bincount(cls_id, weights=fp, minlength=n_classes)
+    mean_ = np.divide(sums, count, out=np.zeros(n_classes), where=count > 0)
+    m2 = np.bincount(cls_id, weights=(fp - mean_[cls_id]) ** 2, minlength=n_classes)
+    return count, mean_, m2
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True, parallel=True)
+    def class_moments(cls_id, fp, n_classes):
+        """Per-class count/mean/M2 via Welford's online algorithm.
+
+        Parallelized across classes rather than rows: each prange
+        iteration owns its accumulators, so there are no reduction races
+        and the per-class results are bit-identical to a sequential scan.
+        """
+        count = np.zeros(n_classes, dtype=np.int64)
+        mean_ = np.zeros(n_classes)
+        m2 = np.zeros(n_classes)
+        for c in prange(n_classes):
+            cnt = 0
+            mu = 0.0
+            acc = 0.0
+            for i in range(fp.size):
+                if cls_id[i] == c:
+                    cnt += 1
+                    delta = fp[i] - mu
+                    mu += delta / cnt
+                    acc += (fp[i] - mu) * delta
+            count[c] = cnt
+            mean_[c] = mu
+            m2[c] = acc
+        return count, mean_, m2
+else:
+    class_moments = _class_moments_np
+
+
 def calc_fp(elims: float, deps: float, wart: float, won: bool) -> float:
     """Calculate fantasy points."""
     stat_points = (elims * FP_ELIM) + (deps * FP_DEP) + (wart * FP_WART)
@@ -30,35 +83,102 @@ def calc_fp(elims: float, deps: float, wart: float, won: bool) -> float:
     return round(stat_points + win_points, 1)
 
 
-async def analyze():
-    # Import here to avoid circular imports
-    from app.feed import get_feed
-
-    feed = await get_feed()
-    store = feed.store
-
-    print(f"\n{'='*60}")
-    print("FANTASY CONTEST STRATEGY ANALYSIS")
-    print(f"{'='*60}")
-    print(f"\nTotal scored matches: {len(store.scored_matches)}")
-
-    # Collect all champion performances
-    # Structure: {token_id: [(class, elims, deps, wart, won, fp), ...]}
-    champion_games: dict[int, list] = defaultdict(list)
-
-    # Also track by class for aggregate analysis
-    class_fps: dict[str, list] = defaultdict(list)
-    class_stats: dict[str, dict] = defaultdict(lambda: {
-        "elims": [], "deps": [], "wart": [], "wins": 0, "games": 0
-    })
+def _flat_cache_path(store) -> Path:
+    """Cache filename keyed by the set of scored match ids."""
+    digest = hashlib.sha1("\n".join(sorted(store.scored_matches)).encode()).hexdigest()
+    # v2: compact dtypes (float32 stats, int8 class ids)
+    return FLAT_CACHE_DIR / f"flat_champions_v2_{digest[:16]}.npz"
+
+
+def _load_flat(path: Path) -> dict | None:
+    """Load flattened columns from disk, or None if absent/unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            token_col = data["token"]
+            token_rows: dict[int, list[int]] = defaultdict(list)
+            for i, t in enumerate(token_col.tolist()):
+                token_rows[t].append(i)
+            return {
+                "cls": data["cls"],
+                "elims": data["elims"],
+                "deps": data["deps"],
+                "wart": data["wart"],
+                "won": data["won"],
+                "token": token_col,
+                "class_ids": meta["class_ids"],
+                "token_rows": dict(token_rows),
+                "token_name": {int(k): v for k, v in meta["token_name"].items()},
+                "token_class": {int(k): v for k, v in meta["token_class"].items()},
+            }
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_flat(path: Path, flat: dict):
+    """Persist flattened columns; best-effort, drops stale siblings."""
+    try:
+        FLAT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in FLAT_CACHE_DIR.glob("flat_champions_*.npz"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        meta = json.dumps({
+            "class_ids": flat["class_ids"],
+            "token_name": flat["token_name"],
+            "token_class": flat["token_class"],
+        })
+        np.savez_compressed(
+            path,
+            cls=flat["cls"],
+            elims=flat["elims"],
+            deps=flat["deps"],
+            wart=flat["wart"],
+            won=flat["won"],
+            token=flat["token"],
+            meta=meta,
+        )
+    except OSError:
+        pass
+
+
+def flatten_scored(store) -> dict:
+    """Flatten champion rows of every scored match into SoA numpy columns.
+
+    Returns a dict with one column per stat (cls, elims, deps, wart, won),
+    the class-name -> id mapping, per-token row indices, and per-token
+    name/class. The result is cached on the store for the process and in
+    ~/.cache/contesttool for repeated script runs on the same data.
+    """
+    cached = getattr(store, "_champion_soa", None)
+    if cached is not None:
+        return cached
+
+    cache_path = _flat_cache_path(store)
+    flat = _load_flat(cache_path)
+    if flat is not None:
+        store._champion_soa = flat
+        return flat
+
+    token_rows: dict[int, list[int]] = defaultdict(list)
+    token_name: dict[int, str] = {}
+    token_class: dict[int, str] = {}
+    class_ids: dict[str, int] = {}
+    col_token: list[int] = []
+    col_cls: list[int] = []
+    col_elims: list[float] = []
+    col_deps: list[float] = []
+    col_wart: list[float] = []
+    col_won: list[bool] = []
 
     for match_id in store.scored_matches:
         match = store.matches.get(match_id)
         if not match:
             continue
 
-        # Map token_id to their performance
-        perf_map = {p["token_id"]: p for p in match.performances if p.get("token_id")}
+        # token_id -> performance, cached on the match record
+        perf_map = match.perf_map
 
         for player in match.players:
             if not player.get("is_champion"):
@@ -75,25 +195,65 @@ async def analyze():
             deps = perf.get("deposits", 0) or 0
             wart = perf.get("wart_distance", 0) or 0
 
-            fp = calc_fp(elims, deps, wart, won)
-
-            champion_games[token_id].append({
-                "class": player_class,
-                "elims": elims,
-                "deps": deps,
-                "wart": wart,
-                "won": won,
-                "fp": fp,
-                "name": player.get("name", "")
-            })
-
-            class_fps[player_class].append(fp)
-            class_stats[player_class]["elims"].append(elims)
-            class_stats[player_class]["deps"].append(deps)
-            class_stats[player_class]["wart"].append(wart)
-            class_stats[player_class]["games"] += 1
-            if won:
-                class_stats[player_class]["wins"] += 1
+            token_rows[token_id].append(len(col_cls))
+            token_name.setdefault(token_id, player.get("name", ""))
+            token_class.setdefault(token_id, player_class)
+
+            col_token.append(token_id)
+            col_cls.append(class_ids.setdefault(player_class, len(class_ids)))
+            col_elims.append(elims)
+            col_deps.append(deps)
+            col_wart.append(wart)
+            col_won.append(won)
+
+    # Compact dtypes: the reductions are memory-bound, so float32 stat
+    # columns and small-int ids halve the bytes scanned per pass.
+    flat = {
+        "cls": np.asarray(col_cls, dtype=np.int8),
+        "elims": np.asarray(col_elims, dtype=np.float32),
+        "deps": np.asarray(col_deps, dtype=np.float32),
+        "wart": np.asarray(col_wart, dtype=np.float32),
+        "won": np.asarray(col_won, dtype=np.bool_),
+        "token": np.asarray(col_token, dtype=np.int32),
+        "class_ids": class_ids,
+        "token_rows": dict(token_rows),
+        "token_name": token_name,
+        "token_class": token_class,
+    }
+    _save_flat(cache_path, flat)
+    store._champion_soa = flat
+    return flat
+
+
+async def analyze():
+    # Import here to avoid circular imports
+    from app.feed import get_feed
+
+    feed = await get_feed()
+    store = feed.store
+
+    print(f"\n{'='*60}")
+    print("FANTASY CONTEST STRATEGY ANALYSIS")
+    print(f"{'='*60}")
+    print(f"\nTotal scored matches: {len(store.scored_matches)}")
+
+    # One flattening pass (cached on the store) yields SoA columns with one
+    # row per (champion, scored match), plus per-token row indices.
+    flat = flatten_scored(store)
+    class_ids = flat["class_ids"]
+    champion_games = flat["token_rows"]
+    token_name = flat["token_name"]
+    token_class = flat["token_class"]
+    cls_arr = flat["cls"]
+    elims_arr = flat["elims"]
+    deps_arr = flat["deps"]
+    wart_arr = flat["wart"]
+    won_arr = flat["won"]
+
+    # Whole fp column in one vectorized expression instead of a calc_fp
+    # call per row (calc_fp stays for scalar callers).
+    stat_fp_arr = elims_arr * FP_ELIM + deps_arr * FP_DEP + wart_arr * FP_WART
+    fp_arr = np.round(stat_fp_arr + won_arr * FP_WIN, 1)
 
     # ==========================================
     # ANALYSIS 1: FP by Class
@@ -105,29 +265,35 @@ async def analyze():
     print("-" * 75)
 
     class_summary = []
-    for cls in sorted(class_fps.keys()):
-        fps = class_fps[cls]
-        stats = class_stats[cls]
-        if len(fps) < 10:
+    n_classes = len(class_ids)
+    cls_counts, cls_means, cls_m2 = class_moments(cls_arr, fp_arr, n_classes)
+    # All per-class sums in four C-level bincount passes
+    cls_wins = np.bincount(cls_arr, weights=won_arr, minlength=n_classes)
+    cls_elims = np.bincount(cls_arr, weights=elims_arr, minlength=n_classes)
+    cls_deps = np.bincount(cls_arr, weights=deps_arr, minlength=n_classes)
+    cls_wart = np.bincount(cls_arr, weights=wart_arr, minlength=n_classes)
+    for cls in sorted(class_ids.keys()):
+        cid = class_ids[cls]
+        fps = fp_arr[cls_arr == cid]
+        n = int(cls_counts[cid])
+        if n < 10:
             continue
 
-        avg_fp = mean(fps)
-        med_fp = median(fps)
-        std_fp = stdev(fps) if len(fps) > 1 else 0
-        win_rate = 100 * stats["wins"] / stats["games"] if stats["games"] > 0 else 0
-        floor = min(fps)
-        ceiling = max(fps)
+        avg_fp = cls_means[cid]
+        med_fp = np.median(fps)
+        std_fp = np.sqrt(cls_m2[cid] / (n - 1)) if n > 1 else 0
+        win_rate = 100 * cls_wins[cid] / n
+        floor = fps.min()
+        ceiling = fps.max()
 
-        # Calculate percentiles
-        sorted_fps = sorted(fps)
-        p10 = sorted_fps[int(len(fps) * 0.1)]
-        p25 = sorted_fps[int(len(fps) * 0.25)]
-        p75 = sorted_fps[int(len(fps) * 0.75)]
-        p90 = sorted_fps[int(len(fps) * 0.9)]
+        # Calculate percentiles - O(n) selection instead of a full sort
+        ks = [int(n * 0.1), int(n * 0.25), int(n * 0.75), int(n * 0.9)]
+        part = np.partition(fps, ks)
+        p10, p25, p75, p90 = part[ks]
 
         class_summary.append({
             "class": cls,
-            "games": len(fps),
+            "games": n,
             "avg_fp": avg_fp,
             "median_fp": med_fp,
             "std_fp": std_fp,
@@ -138,12 +304,12 @@ async def analyze():
             "p25": p25,
             "p75": p75,
             "p90": p90,
-            "avg_elims": mean(stats["elims"]),
-            "avg_deps": mean(stats["deps"]),
-            "avg_wart": mean(stats["wart"])
+            "avg_elims": cls_elims[cid] / n,
+            "avg_deps": cls_deps[cid] / n,
+            "avg_wart": cls_wart[cid] / n
         })
 
-        print(f"{cls:<12} {len(fps):>6} {avg_fp:>8.1f} {med_fp:>8.1f} {std_fp:>8.1f} {win_rate:>6.1f}% {floor:>8.1f} {ceiling:>8.1f}")
+        print(f"{cls:<12} {n:>6} {avg_fp:>8.1f} {med_fp:>8.1f} {std_fp:>8.1f} {win_rate:>6.1f}% {floor:>8.1f} {ceiling:>8.1f}")
 
     # ==========================================
     # ANALYSIS 2: Win Impact
@@ -152,33 +318,23 @@ async def analyze():
     print("ANALYSIS 2: WIN BONUS IMPACT")
     print(f"{'='*60}")
 
-    all_wins_fp = []
-    all_losses_fp = []
-    all_wins_stat_fp = []  # FP without win bonus
-    all_losses_stat_fp = []
-
-    for token_id, games in champion_games.items():
-        for g in games:
-            stat_fp = (g["elims"] * FP_ELIM) + (g["deps"] * FP_DEP) + (g["wart"] * FP_WART)
-            if g["won"]:
-                all_wins_fp.append(g["fp"])
-                all_wins_stat_fp.append(stat_fp)
-            else:
-                all_losses_fp.append(g["fp"])
-                all_losses_stat_fp.append(stat_fp)
+    all_wins_fp = fp_arr[won_arr]
+    all_losses_fp = fp_arr[~won_arr]
+    all_wins_stat_fp = stat_fp_arr[won_arr]  # FP without win bonus
+    all_losses_stat_fp = stat_fp_arr[~won_arr]
 
     print(f"\nWins ({len(all_wins_fp)} games):")
-    print(f"  Avg Total FP: {mean(all_wins_fp):.1f}")
-    print(f"  Avg Stat FP (no win bonus): {mean(all_wins_stat_fp):.1f}")
+    print(f"  Avg Total FP: {all_wins_fp.mean():.1f}")
+    print(f"  Avg Stat FP (no win bonus): {all_wins_stat_fp.mean():.1f}")
     print(f"  Win bonus adds: {FP_WIN} pts")
 
     print(f"\nLosses ({len(all_losses_fp)} games):")
-    print(f"  Avg Total FP: {mean(all_losses_fp):.1f}")
-    print(f"  Avg Stat FP: {mean(all_losses_stat_fp):.1f}")
+    print(f"  Avg Total FP: {all_losses_fp.mean():.1f}")
+    print(f"  Avg Stat FP: {all_losses_stat_fp.mean():.1f}")
 
     print(f"\nKey Insight:")
-    print(f"  Average FP difference (Win vs Loss): {mean(all_wins_fp) - mean(all_losses_fp):.1f} pts")
-    print(f"  Stat-only difference: {mean(all_wins_stat_fp) - mean(all_losses_stat_fp):.1f} pts")
+    print(f"  Average FP difference (Win vs Loss): {all_wins_fp.mean() - all_losses_fp.mean():.1f} pts")
+    print(f"  Stat-only difference: {all_wins_stat_fp.mean() - all_losses_stat_fp.mean():.1f} pts")
     print(f"  This means winners have slightly better stats too!")
 
     # ==========================================
@@ -219,26 +375,44 @@ async def analyze():
     print("ANALYSIS 5: TOP CONSISTENT PERFORMERS (Min 5 games)")
     print(f"{'='*60}")
 
+    # One stable argsort over the token column turns every player's games
+    # into a contiguous slice - no per-player index gathers. Groups are
+    # still visited in first-appearance order so tie ordering in the
+    # ranked tables is unchanged.
+    token_arr = flat["token"]
+    order = np.argsort(token_arr, kind="stable")
+    fp_by_token = fp_arr[order]
+    won_by_token = won_arr[order]
+    sorted_tokens = token_arr[order]
+    uniq_tokens, group_starts = np.unique(sorted_tokens, return_index=True)
+    group_ends = np.append(group_starts[1:], sorted_tokens.size)
+    group_bounds = {
+        int(tok): (int(start), int(end))
+        for tok, start, end in zip(uniq_tokens, group_starts, group_ends)
+    }
+
     player_summary = []
-    for token_id, games in champion_games.items():
-        if len(games) < 5:
+    for token_id in champion_games:
+        start, end = group_bounds[token_id]
+        n_games = end - start
+        if n_games < 5:
             continue
 
-        fps = [g["fp"] for g in games]
-        wins = sum(1 for g in games if g["won"])
-        sorted_fps = sorted(fps)
+        fps = fp_by_token[start:end]
+        wins = int(won_by_token[start:end].sum())
+        k10 = int(n_games * 0.1)
 
         player_summary.append({
             "token_id": token_id,
-            "name": games[0]["name"],
-            "class": games[0]["class"],
-            "games": len(games),
-            "avg_fp": mean(fps),
-            "median_fp": median(fps),
-            "std_fp": stdev(fps) if len(fps) > 1 else 0,
-            "floor": min(fps),
-            "p10": sorted_fps[int(len(fps) * 0.1)] if len(fps) >= 10 else min(fps),
-            "win_rate": 100 * wins / len(games)
+            "name": token_name[token_id],
+            "class": token_class[token_id],
+            "games": n_games,
+            "avg_fp": fps.mean(),
+            "median_fp": np.median(fps),
+            "std_fp": fps.std(ddof=1) if n_games > 1 else 0,
+            "floor": fps.min(),
+            "p10": np.partition(fps, k10)[k10] if n_games >= 10 else fps.min(),
+            "win_rate": 100 * wins / n_games
         })
 
     # Sort by floor (consistency)
@@ -305,7 +479,7 @@ KEY FINDINGS:
    - Prioritize champions with HIGH WIN RATES when matchups are favorable
 
 2. CLASS TIER LIST (by Floor/Consistency):
-""".format(mean(all_wins_fp), mean(all_losses_fp)))
+""".format(all_wins_fp.mean(), all_losses_fp.mean()))
 
     for i, cs in enumerate(sorted_by_floor[:5], 1):
         print(f"   {i}. {cs['class']}: Floor={cs['p10']:.0f}, Avg={cs['avg_fp']:.0f}, WinRate={cs['win_rate']:.1f}%")
@@ -9,6 +9,90 @@ but two gacha depositors together can be a benefit.
 import asyncio
 from collections import defaultdict
 
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Role codes in lexicographic order of the role names, so a sort of codes
+# yields the same pattern ordering as a sort of the strings.
+ROLE_NAMES = ("BALANCED", "ELIM", "GACHA", "HYBRID_E", "HYBRID_G")
+BALANCED, ELIM, GACHA, HYBRID_E, HYBRID_G = range(5)
+
+
+def roles_vec(deps: np.ndarray, elims: np.ndarray) -> np.ndarray:
+    """Branchless vectorized get_supporter_role over whole stat arrays.
+
+    Returns int8 role codes (see ROLE_NAMES). Conditions mirror the
+    scalar if/elif chain exactly, in the same priority order.
+    """
+    return np.select(
+        [
+            (deps >= 3.0) & (elims < 0.8),
+            (deps >= 2.0) & (elims < 1.0),
+            (elims >= 1.8) & (deps < 1.2),
+            (elims >= 1.5) & (deps < 1.5),
+            deps >= 2.0,
+            elims >= 1.2,
+        ],
+        [GACHA, GACHA, ELIM, ELIM, HYBRID_G, HYBRID_E],
+        default=BALANCED,
+    ).astype(np.int8)
+
+
+ROLE_CODES = {name: code for code, name in enumerate(ROLE_NAMES)}
+
+# role code -> counts toward the team's gacha total (GACHA, HYBRID_G).
+# Constant-time LUT indexing instead of a tuple membership test per role.
+IS_GACHA = (0, 0, 1, 0, 1)
+
+# Composition keys pack up to three sorted role codes into one int (8 bits
+# per slot, 0xFF marking an empty slot). Small-int dict keys hash faster
+# than pattern strings and avoid per-match string allocation.
+_EMPTY_SLOT = 0xFF
+UNKNOWN_COMP = _EMPTY_SLOT | (_EMPTY_SLOT << 8) | (_EMPTY_SLOT << 16)
+
+
+def comp_key(role_codes: list[int]) -> int:
+    """Pack sorted role codes into a single int composition key."""
+    r = sorted(role_codes)
+    return (
+        (r[0] if r else _EMPTY_SLOT)
+        | (r[1] if len(r) > 1 else _EMPTY_SLOT) << 8
+        | (r[2] if len(r) > 2 else _EMPTY_SLOT) << 16
+    )
+
+
+def comp_name(key: int) -> str:
+    """Unpack a composition key back to its 'ROLE-ROLE' display string."""
+    if key == UNKNOWN_COMP:
+        return "UNKNOWN"
+    slots = (key & 0xFF, (key >> 8) & 0xFF, (key >> 16) & 0xFF)
+    return "-".join(ROLE_NAMES[s] for s in slots if s != _EMPTY_SLOT)
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def accumulate_comp_counts(comp_a, comp_b, won_a, n, games, wins, mg, mw):
+        """One compiled pass filling per-comp and per-pair games/wins."""
+        for i in range(comp_a.size):
+            a = comp_a[i]
+            b = comp_b[i]
+            w = won_a[i]
+            games[a] += 1
+            wins[a] += w
+            games[b] += 1
+            wins[b] += 1 - w
+            k1 = a * n + b
+            k2 = b * n + a
+            mg[k1] += 1
+            mw[k1] += w
+            mg[k2] += 1
+            mw[k2] += 1 - w
+
 
 def get_supporter_role(stats):
     """Categorize a supporter based on career stats."""
@@ -60,21 +144,41 @@ async def analyze():
     print(f"{'='*70}")
     print(f"Total scored matches: {len(store.scored_matches)}")
 
-    # Data structures
-    # 1. Composition pattern win rates
-    composition_stats = defaultdict(lambda: {"wins": 0, "games": 0})
-
-    # 2. Composition vs Composition matchups
-    comp_vs_comp = defaultdict(lambda: {"wins": 0, "games": 0})
-
-    # 3. Champion class + composition pattern
-    class_comp_stats = defaultdict(lambda: {"wins": 0, "games": 0})
-
-    # 4. Gacha count analysis (1 gacha vs 2 gacha)
-    gacha_count_stats = defaultdict(lambda: {"wins": 0, "games": 0})
-
-    # 5. Win type by composition
-    win_type_by_comp = defaultdict(lambda: defaultdict(int))
+    # Classify every token with cumulative stats in one vectorized
+    # np.select pass; tokens the feed has no stats for fall back to the
+    # scalar path (which classifies the default stats as BALANCED).
+    known_tokens = list(store.cumulative_stats.keys())
+    deps_arr = np.array(
+        [store.cumulative_stats[t]["avg_deps"] for t in known_tokens]
+    )
+    elims_arr = np.array(
+        [store.cumulative_stats[t]["avg_elims"] for t in known_tokens]
+    )
+    role_cache: dict[int, int] = {
+        t: int(code)
+        for t, code in zip(known_tokens, roles_vec(deps_arr, elims_arr))
+    }
+
+    def role_for(token_id: int) -> int:
+        role = role_cache.get(token_id)
+        if role is None:
+            role = ROLE_CODES[get_supporter_role(store.get_career_stats(token_id))]
+            role_cache[token_id] = role
+        return role
+
+    # One-time flattening pass: per-match SoA columns. Each analysis block
+    # below groups over these flat columns instead of re-walking
+    # match.players and career stats per aggregation.
+    m_comp1, m_comp2 = [], []
+    m_class1, m_class2 = [], []
+    m_gacha1, m_gacha2 = [], []
+    m_won1, m_win_type = [], []
+
+    # Gacha matchup counters for ANALYSIS 3, fused into the same pass.
+    # Tracked before the champion check because that analysis counts all
+    # scored matches, even ones missing a champion on either team.
+    one_vs_two = {"wins": 0, "games": 0}
+    two_vs_one = {"wins": 0, "games": 0}
 
     for match_id in store.scored_matches:
         match = store.matches.get(match_id)
@@ -94,77 +198,119 @@ async def analyze():
             else:
                 supporters[team].append(player)
 
-        if not champions[1] or not champions[2]:
-            continue
+        # Get supporter roles for counting
+        roles1 = [role_for(s["token_id"]) for s in supporters[1] if s.get("token_id")]
+        roles2 = [role_for(s["token_id"]) for s in supporters[2] if s.get("token_id")]
 
-        # Get composition patterns for each team
-        comp1 = get_composition_pattern(supporters[1], store)
-        comp2 = get_composition_pattern(supporters[2], store)
+        gacha1 = sum(IS_GACHA[r] for r in roles1)
+        gacha2 = sum(IS_GACHA[r] for r in roles2)
+        won1 = match.team_won == 1
 
-        class1 = champions[1].get("class", "Unknown")
-        class2 = champions[2].get("class", "Unknown")
+        if gacha1 == 1 and gacha2 == 2:
+            one_vs_two["games"] += 1
+            one_vs_two["wins"] += won1
+        elif gacha1 == 2 and gacha2 == 1:
+            two_vs_one["games"] += 1
+            two_vs_one["wins"] += won1
 
-        # Get supporter roles for counting
-        roles1 = [get_supporter_role(store.get_career_stats(s["token_id"]))
-                  for s in supporters[1] if s.get("token_id")]
-        roles2 = [get_supporter_role(store.get_career_stats(s["token_id"]))
-                  for s in supporters[2] if s.get("token_id")]
+        if not champions[1] or not champions[2]:
+            continue
 
-        # Count gacha supporters
-        gacha1 = sum(1 for r in roles1 if r in ("GACHA", "HYBRID_G"))
-        gacha2 = sum(1 for r in roles2 if r in ("GACHA", "HYBRID_G"))
+        m_comp1.append(comp_key(roles1))
+        m_comp2.append(comp_key(roles2))
+        m_class1.append(champions[1].get("class", "Unknown"))
+        m_class2.append(champions[2].get("class", "Unknown"))
+        m_gacha1.append(gacha1)
+        m_gacha2.append(gacha2)
+        m_won1.append(won1)
+        m_win_type.append(match.win_type or "unknown")
+
+    # Factorize composition keys to dense ids (first-seen order, which the
+    # ranked printouts rely on for tie ordering) and stack both teams into
+    # one column of 2 rows per match. Win/game counts then reduce to
+    # branchless bincount passes.
+    comp_ids: dict[int, int] = {}
+    cid1 = np.empty(len(m_comp1), dtype=np.int64)
+    cid2 = np.empty(len(m_comp2), dtype=np.int64)
+    for i, (c1, c2) in enumerate(zip(m_comp1, m_comp2)):
+        cid1[i] = comp_ids.setdefault(c1, len(comp_ids))
+        cid2[i] = comp_ids.setdefault(c2, len(comp_ids))
+    n_comp = len(comp_ids)
+    comp_id_list = list(comp_ids)
+    won1_arr = np.asarray(m_won1, dtype=np.bool_)
+    won_col = np.concatenate([won1_arr, ~won1_arr])
+
+    # 1.+2. Composition pattern win rates and head-to-head matchups.
+    # Filled in a single compiled pass when numba is available; otherwise
+    # the stacked bincount reductions produce the same arrays.
+    if _HAVE_NUMBA:
+        comp_games = np.zeros(n_comp, dtype=np.int64)
+        comp_wins = np.zeros(n_comp, dtype=np.int64)
+        pair_games = np.zeros(n_comp * n_comp, dtype=np.int64)
+        pair_wins = np.zeros(n_comp * n_comp, dtype=np.int64)
+        accumulate_comp_counts(
+            cid1, cid2, won1_arr.astype(np.int64), n_comp,
+            comp_games, comp_wins, pair_games, pair_wins,
+        )
+    else:
+        comp_col = np.concatenate([cid1, cid2])
+        comp_games = np.bincount(comp_col, minlength=n_comp)
+        comp_wins = np.bincount(comp_col, weights=won_col, minlength=n_comp)
+        pair_col = np.concatenate([cid1 * n_comp + cid2, cid2 * n_comp + cid1])
+        pair_games = np.bincount(pair_col, minlength=n_comp * n_comp)
+        pair_wins = np.bincount(pair_col, weights=won_col, minlength=n_comp * n_comp)
+
+    composition_stats = {
+        comp: {"wins": int(comp_wins[cid]), "games": int(comp_games[cid])}
+        for comp, cid in comp_ids.items()
+    }
+
+    pair_keys: dict[tuple[int, int], None] = {}
+    for a, b in zip(cid1.tolist(), cid2.tolist()):
+        pair_keys.setdefault((a, b), None)
+        pair_keys.setdefault((b, a), None)
+    comp_vs_comp = {
+        (comp_id_list[a], comp_id_list[b]): {
+            "wins": int(pair_wins[a * n_comp + b]),
+            "games": int(pair_games[a * n_comp + b]),
+        }
+        for a, b in pair_keys
+    }
 
-        # Analyze from team 1's perspective
-        won1 = match.team_won == 1
-        win_type = match.win_type or "unknown"
-
-        # 1. Composition pattern stats
-        composition_stats[comp1]["games"] += 1
-        if won1:
-            composition_stats[comp1]["wins"] += 1
-
-        composition_stats[comp2]["games"] += 1
-        if not won1:
-            composition_stats[comp2]["wins"] += 1
-
-        # 2. Composition vs composition
-        key1 = f"{comp1} vs {comp2}"
-        comp_vs_comp[key1]["games"] += 1
-        if won1:
-            comp_vs_comp[key1]["wins"] += 1
-
-        key2 = f"{comp2} vs {comp1}"
-        comp_vs_comp[key2]["games"] += 1
-        if not won1:
-            comp_vs_comp[key2]["wins"] += 1
-
-        # 3. Class + composition
-        class_comp1 = f"{class1} + {comp1}"
+    # 3. Champion class + composition pattern
+    class_comp_stats = defaultdict(lambda: {"wins": 0, "games": 0})
+    for class1, comp1, class2, comp2, won1 in zip(
+        m_class1, m_comp1, m_class2, m_comp2, m_won1
+    ):
+        class_comp1 = (class1, comp1)
         class_comp_stats[class_comp1]["games"] += 1
-        if won1:
-            class_comp_stats[class_comp1]["wins"] += 1
-
-        class_comp2 = f"{class2} + {comp2}"
+        class_comp_stats[class_comp1]["wins"] += won1
+        class_comp2 = (class2, comp2)
         class_comp_stats[class_comp2]["games"] += 1
-        if not won1:
-            class_comp_stats[class_comp2]["wins"] += 1
-
-        # 4. Gacha count analysis
-        gacha_key1 = f"{gacha1}_gacha"
-        gacha_count_stats[gacha_key1]["games"] += 1
-        if won1:
-            gacha_count_stats[gacha_key1]["wins"] += 1
-
-        gacha_key2 = f"{gacha2}_gacha"
-        gacha_count_stats[gacha_key2]["games"] += 1
-        if not won1:
-            gacha_count_stats[gacha_key2]["wins"] += 1
-
-        # 5. Win type by composition (winner only)
-        if won1:
-            win_type_by_comp[comp1][win_type] += 1
-        else:
-            win_type_by_comp[comp2][win_type] += 1
+        class_comp_stats[class_comp2]["wins"] += not won1
+
+    # 4. Gacha count analysis (1 gacha vs 2 gacha) - same stacked trick
+    gacha_col = np.concatenate([m_gacha1, m_gacha2]).astype(np.int64)
+    gacha_games = np.bincount(gacha_col)
+    gacha_wins = np.bincount(gacha_col, weights=won_col)
+    gacha_count_stats = {
+        count: {"wins": int(gacha_wins[count]), "games": int(gacha_games[count])}
+        for count in range(len(gacha_games))
+    }
+
+    # 5. Win type by composition (winner only). Both dimensions are
+    # factorized to dense ids and counted into one contingency table
+    # instead of a nested dict-of-dicts.
+    win_comp_ids: dict[int, int] = {}
+    win_type_ids: dict[str, int] = {}
+    win_comp_col: list[int] = []
+    win_type_col: list[int] = []
+    for comp1, comp2, won1, win_type in zip(m_comp1, m_comp2, m_won1, m_win_type):
+        winner = comp1 if won1 else comp2
+        win_comp_col.append(win_comp_ids.setdefault(winner, len(win_comp_ids)))
+        win_type_col.append(win_type_ids.setdefault(win_type, len(win_type_ids)))
+    win_type_table = np.zeros((len(win_comp_ids), len(win_type_ids)), dtype=np.int32)
+    np.add.at(win_type_table, (win_comp_col, win_type_col), 1)
 
     # ==========================================
     # ANALYSIS 1: Overall Composition Win Rates
@@ -186,7 +332,7 @@ async def analyze():
         if stats["games"] >= 50:
             wr = 100 * stats["wins"] / stats["games"]
             bar = "#" * int(wr / 5)
-            print(f"{comp:<25} {stats['games']:>8} {stats['wins']:>8} {wr:>7.1f}% {bar}")
+            print(f"{comp_name(comp):<25} {stats['games']:>8} {stats['wins']:>8} {wr:>7.1f}% {bar}")
 
     # ==========================================
     # ANALYSIS 2: Gacha Count Win Rates
@@ -196,12 +342,12 @@ async def analyze():
     print(f"{'='*70}")
     print("\nDoes having 2 gacha supporters beat having 1?\n")
 
-    for key in ["0_gacha", "1_gacha", "2_gacha"]:
-        stats = gacha_count_stats[key]
+    for count in (0, 1, 2):
+        stats = gacha_count_stats.get(count, {"wins": 0, "games": 0})
         if stats["games"] >= 50:
             wr = 100 * stats["wins"] / stats["games"]
             bar = "#" * int(wr / 2)
-            print(f"{key}: {wr:5.1f}% win rate ({stats['games']} games) {bar}")
+            print(f"{count}_gacha: {wr:5.1f}% win rate ({stats['games']} games) {bar}")
 
     # ==========================================
     # ANALYSIS 3: 1 Gacha vs 2 Gacha Matchups
@@ -211,40 +357,6 @@ async def analyze():
     print(f"{'='*70}")
     print("\nWhen 1-gacha team faces 2-gacha team, who wins?\n")
 
-    # Find these specific matchups
-    one_vs_two = {"wins": 0, "games": 0}
-    two_vs_one = {"wins": 0, "games": 0}
-
-    for match_id in store.scored_matches:
-        match = store.matches.get(match_id)
-        if not match or not match.team_won:
-            continue
-
-        supporters = {1: [], 2: []}
-        for player in match.players:
-            team = player.get("team")
-            if team and not player.get("is_champion"):
-                supporters[team].append(player)
-
-        roles1 = [get_supporter_role(store.get_career_stats(s["token_id"]))
-                  for s in supporters[1] if s.get("token_id")]
-        roles2 = [get_supporter_role(store.get_career_stats(s["token_id"]))
-                  for s in supporters[2] if s.get("token_id")]
-
-        gacha1 = sum(1 for r in roles1 if r in ("GACHA", "HYBRID_G"))
-        gacha2 = sum(1 for r in roles2 if r in ("GACHA", "HYBRID_G"))
-
-        won1 = match.team_won == 1
-
-        if gacha1 == 1 and gacha2 == 2:
-            one_vs_two["games"] += 1
-            if won1:
-                one_vs_two["wins"] += 1
-        elif gacha1 == 2 and gacha2 == 1:
-            two_vs_one["games"] += 1
-            if won1:
-                two_vs_one["wins"] += 1
-
     if one_vs_two["games"] >= 20:
         wr = 100 * one_vs_two["wins"] / one_vs_two["games"]
         print(f"1 Gacha vs 2 Gacha: {wr:5.1f}% win rate for 1-gacha team ({one_vs_two['games']} games)")
@@ -260,13 +372,22 @@ async def analyze():
     print(f"{'='*70}")
     print("\nDo gacha-heavy compositions actually win via gacha?\n")
 
-    for comp, win_types in sorted(win_type_by_comp.items(), key=lambda x: sum(x[1].values()), reverse=True)[:10]:
-        total = sum(win_types.values())
+    win_totals = win_type_table.sum(axis=1)
+    comp_by_id = list(win_comp_ids)
+
+    def wt_count(row, name):
+        wt_id = win_type_ids.get(name)
+        return int(row[wt_id]) if wt_id is not None else 0
+
+    top_ids = sorted(range(len(comp_by_id)), key=lambda i: win_totals[i], reverse=True)
+    for cid in top_ids[:10]:
+        total = int(win_totals[cid])
         if total >= 50:
-            gacha_pct = 100 * win_types.get("gacha", 0) / total
-            elim_pct = 100 * win_types.get("eliminations", 0) / total
-            dep_pct = 100 * win_types.get("deposits", 0) / total
-            print(f"{comp:<25}: Elim {elim_pct:4.0f}% | Gacha {gacha_pct:4.0f}% | Dep {dep_pct:4.0f}% ({total} wins)")
+            row = win_type_table[cid]
+            gacha_pct = 100 * wt_count(row, "gacha") / total
+            elim_pct = 100 * wt_count(row, "eliminations") / total
+            dep_pct = 100 * wt_count(row, "deposits") / total
+            print(f"{comp_name(comp_by_id[cid]):<25}: Elim {elim_pct:4.0f}% | Gacha {gacha_pct:4.0f}% | Dep {dep_pct:4.0f}% ({total} wins)")
 
     # ==========================================
     # ANALYSIS 5: Champion Class + Composition
@@ -278,13 +399,10 @@ async def analyze():
 
     # Group by class
     by_class = defaultdict(list)
-    for class_comp, stats in class_comp_stats.items():
+    for (champ_class, comp), stats in class_comp_stats.items():
         if stats["games"] >= 30:
-            parts = class_comp.split(" + ", 1)
-            if len(parts) == 2:
-                champ_class, comp = parts
-                wr = 100 * stats["wins"] / stats["games"]
-                by_class[champ_class].append((comp, wr, stats["games"]))
+            wr = 100 * stats["wins"] / stats["games"]
+            by_class[champ_class].append((comp_name(comp), wr, stats["games"]))
 
     for champ_class in ["Defender", "Striker", "Bruiser", "Center", "Sprinter", "Grinder"]:
         if champ_class in by_class:
@@ -304,11 +422,13 @@ async def analyze():
 
     # Find matchups with significant sample and non-50% win rates
     significant_matchups = []
-    for key, stats in comp_vs_comp.items():
+    for (comp_a, comp_b), stats in comp_vs_comp.items():
         if stats["games"] >= 30:
             wr = 100 * stats["wins"] / stats["games"]
             if abs(wr - 50) >= 5:  # At least 5% deviation from 50%
-                significant_matchups.append((key, wr, stats["games"]))
+                significant_matchups.append(
+                    (f"{comp_name(comp_a)} vs {comp_name(comp_b)}", wr, stats["games"])
+                )
 
     significant_matchups.sort(key=lambda x: abs(x[1] - 50), reverse=True)
     for matchup, wr, games in significant_matchups[:15]:
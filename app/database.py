@@ -9,6 +9,17 @@ DB_PATH = Path(__file__).parent.parent / "grandarena.db"
 def get_connection() -> sqlite3.Connection:
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    # Read-path tuning: WAL lets readers run alongside a writer, temp tables
+    # live in memory, and a larger page cache keeps the hot aggregate scans
+    # off disk. Applied once per connection.
+    for pragma in (
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        "temp_store=MEMORY",
+        "cache_size=-131072",
+        "mmap_size=268435456",
+    ):
+        conn.execute(f"PRAGMA {pragma}")
     return conn
 
 
@@ -1,5 +1,7 @@
 """Feed module - coordinates fetching, caching, and data store management."""
 
+import asyncio
+import heapq
 import logging
 from typing import Optional
 
@@ -30,6 +32,9 @@ class FeedCoordinator:
         self.store = FeedDataStore()
         self._initialized = False
         self._manifest: Optional[dict] = None
+        # Shared first-init task: concurrent startup requests await the
+        # same refresh instead of each fetching the whole feed
+        self._init_task: Optional[asyncio.Task] = None
 
     @classmethod
     def get_instance(cls) -> "FeedCoordinator":
@@ -44,10 +49,26 @@ class FeedCoordinator:
         cls._instance = None
 
     async def initialize(self):
-        """Initialize the feed coordinator - fetch manifest and load data."""
+        """Initialize the feed coordinator - fetch manifest and load data.
+
+        Safe under concurrency: the first caller starts the refresh and
+        every concurrent caller awaits that same task (shielded, so one
+        cancelled request doesn't abort startup for the rest). A failed
+        init clears the task so the next request can retry.
+        """
         if self._initialized:
             return
 
+        if self._init_task is None:
+            self._init_task = asyncio.create_task(self._do_initialize())
+        try:
+            await asyncio.shield(self._init_task)
+        finally:
+            if self._init_task is not None and self._init_task.done():
+                self._init_task = None
+
+    async def _do_initialize(self):
+        """Perform the actual first-time refresh."""
         logger.info("Initializing feed coordinator...")
         logger.info(f"Feed base URL: {config.base_url}")
 
@@ -75,28 +96,39 @@ class FeedCoordinator:
         # Clear store before reloading (to handle removed matches)
         self.store.clear()
 
-        # Fetch needed partitions
-        for partition in partitions_to_load:
-            partition_key = f"partition:{partition['date']}"
-            try:
-                partition_data = await self.cache.get_or_fetch(
-                    partition_key,
-                    lambda p=partition: self.client.fetch_partition(p["url"]),
+        # Fetch all partitions plus cumulative stats concurrently - the
+        # network I/O overlaps while the store loads stay sequential below
+        # (load_partition mutates shared indexes)
+        fetches = [
+            self.cache.get_or_fetch(
+                f"partition:{partition['date']}",
+                lambda validators, p=partition: self.client.fetch_partition(
+                    p["url"], validators
+                ),
+            )
+            for partition in partitions_to_load
+        ]
+        fetches.append(
+            self.cache.get_or_fetch("cumulative", self.client.fetch_cumulative)
+        )
+        *partition_results, cumulative = await asyncio.gather(
+            *fetches, return_exceptions=True
+        )
+
+        for partition, result in zip(partitions_to_load, partition_results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Failed to load partition {partition['date']}: {result}"
                 )
-                self.store.load_partition(partition_data)
-            except Exception as e:
-                logger.warning(f"Failed to load partition {partition['date']}: {e}")
                 # Continue with other partitions
+                continue
+            self.store.load_partition(result)
 
-        # Fetch cumulative stats
-        try:
-            cumulative = await self.cache.get_or_fetch(
-                "cumulative", self.client.fetch_cumulative
-            )
-            self.store.load_cumulative(cumulative)
-        except Exception as e:
-            logger.warning(f"Failed to load cumulative stats: {e}")
+        if isinstance(cumulative, BaseException):
+            logger.warning(f"Failed to load cumulative stats: {cumulative}")
             # Continue without cumulative - will use defaults
+        else:
+            self.store.load_cumulative(cumulative)
 
         # Rebuild aggregates
         self.store.rebuild_aggregates()
@@ -107,11 +139,11 @@ class FeedCoordinator:
         """Select which partitions to load based on config."""
         partitions = manifest.get("partitions", [])
 
-        # Sort by date descending and take most recent N
-        sorted_partitions = sorted(
-            partitions, key=lambda p: p.get("date", ""), reverse=True
+        # Most recent N by date, without sorting the whole manifest
+        # (nlargest is O(P log N) and returns them descending already)
+        selected = heapq.nlargest(
+            config.max_partitions, partitions, key=lambda p: p.get("date", "")
         )
-        selected = sorted_partitions[: config.max_partitions]
 
         logger.info(
             f"Selected {len(selected)} of {len(partitions)} partitions "
@@ -2,16 +2,38 @@
 
 import asyncio
 import logging
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar
 
+import orjson
+
 from .config import config
+from .exceptions import FeedNotModifiedError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Keys that are never evicted by the size budget
+_PINNED_KEYS = frozenset({"manifest"})
+
+
+def _estimate_size(data: Any) -> int:
+    """Rough payload size in bytes, for the cache memory budget.
+
+    Serialized JSON length tracks the decompressed feed size closely and
+    orjson makes the estimate cheap; anything unserializable falls back to
+    a shallow getsizeof.
+    """
+    try:
+        return len(orjson.dumps(data))
+    except TypeError:
+        return sys.getsizeof(data)
+
 
 @dataclass
 class CacheEntry(Generic[T]):
@@ -20,11 +42,25 @@ class CacheEntry(Generic[T]):
     data: T
     fetched_at: datetime
     ttl_seconds: int
+    # Conditional request headers (If-None-Match / If-Modified-Since) from
+    # the response that produced this entry
+    validators: dict = field(default_factory=dict)
+    # Estimated payload size, charged against config.max_cache_bytes
+    size_bytes: int = 0
+    # Monotonic capture time; ages are computed from this so wall-clock
+    # jumps can't falsely expire (or resurrect) entries. fetched_at stays
+    # around for get_entry_info display only
+    fetched_at_mono: float = field(default_factory=time.monotonic)
+
+    def touch(self):
+        """Re-arm the entry after a 304 revalidation without new data."""
+        self.fetched_at = datetime.now()
+        self.fetched_at_mono = time.monotonic()
 
     @property
     def age_seconds(self) -> float:
         """Get age of cache entry in seconds."""
-        return (datetime.now() - self.fetched_at).total_seconds()
+        return time.monotonic() - self.fetched_at_mono
 
     @property
     def is_fresh(self) -> bool:
@@ -42,58 +78,165 @@ class CacheEntry(Generic[T]):
 class FeedCache:
     """TTL cache with stale-while-revalidate pattern."""
 
-    _entries: dict[str, CacheEntry] = field(default_factory=dict)
-    _refresh_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # LRU order: recently served keys sit at the end, eviction pops from
+    # the front. Bounded by config.max_cache_bytes so partition entries
+    # for dates that rotated out of the manifest don't accumulate forever
+    _entries: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
+    _total_bytes: int = 0
+    # Singleflight map: one in-flight foreground fetch per key; fetches for
+    # distinct keys (manifest vs. each partition) proceed in parallel. Each
+    # fetch runs as its own task so a cancelled caller can't kill it out
+    # from under the other waiters
+    _inflight: dict[str, asyncio.Task] = field(default_factory=dict)
+    # In-flight background refreshes, one task at most per key
+    _refresh_tasks: dict[str, asyncio.Task] = field(default_factory=dict)
 
     async def get_or_fetch(
         self,
         key: str,
-        fetch_fn: Callable[[], Awaitable[T]],
+        fetch_fn: Callable[[dict], Awaitable[tuple[T, dict]]],
         ttl: Optional[int] = None,
     ) -> T:
-        """Get cached value or fetch if stale, serve stale on failure."""
+        """Get cached value or fetch if stale, serve stale on failure.
+
+        Stale-but-usable entries are served immediately with the refresh
+        kicked off as a background task, so only cold misses (or entries
+        past the grace period) pay fetch latency on the request path.
+
+        ``fetch_fn`` receives the entry's conditional request headers and
+        returns (data, validators); raising FeedNotModifiedError re-arms
+        the existing entry without a body transfer.
+        """
         ttl = ttl or config.ttl_seconds
         entry = self._entries.get(key)
 
-        # Fresh cache hit
-        if entry and entry.is_fresh:
-            logger.debug(f"Cache hit (fresh) for {key}, age={entry.age_seconds:.1f}s")
-            return entry.data
+        if entry:
+            self._entries.move_to_end(key)
+            # One clock read per call; the freshness checks below reuse it
+            age = time.monotonic() - entry.fetched_at_mono
 
-        # Need to refresh - acquire lock to prevent thundering herd
-        async with self._refresh_lock:
-            # Double-check after acquiring lock
-            entry = self._entries.get(key)
-            if entry and entry.is_fresh:
+            # Fresh cache hit
+            if age < entry.ttl_seconds:
+                logger.debug(f"Cache hit (fresh) for {key}, age={age:.1f}s")
                 return entry.data
 
-            # Try to fetch new data
-            try:
-                if entry:
-                    logger.info(f"Cache stale for {key}, refreshing...")
-                else:
-                    logger.info(f"Cache miss for {key}, fetching...")
-
-                data = await fetch_fn()
-                self._entries[key] = CacheEntry(
-                    data=data,
-                    fetched_at=datetime.now(),
-                    ttl_seconds=ttl,
-                )
-                return data
-
-            except Exception as e:
-                # Serve stale if available and within grace period
-                if entry and entry.is_stale_but_usable:
-                    logger.warning(
-                        f"Fetch failed for {key}, serving stale data "
-                        f"(age={entry.age_seconds:.1f}s): {e}"
+            # Stale but within grace: serve now, revalidate in background
+            if age < entry.ttl_seconds + config.stale_grace_seconds:
+                if key not in self._refresh_tasks:
+                    logger.info(f"Cache stale for {key}, refreshing in background...")
+                    task = asyncio.create_task(
+                        self._background_refresh(key, fetch_fn, ttl)
+                    )
+                    self._refresh_tasks[key] = task
+                    task.add_done_callback(
+                        lambda _t: self._refresh_tasks.pop(key, None)
                     )
-                    return entry.data
+                return entry.data
+
+        # Cold miss or past grace - fetch on the request path. Concurrent
+        # callers for the same key share one fetch task via the singleflight
+        # map; other keys are unaffected. Every caller awaits through a
+        # shield, so cancelling a caller (including the one that started the
+        # task) never cancels the shared fetch or strands the other waiters
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, fetch_fn, ttl, entry))
+            self._inflight[key] = task
+
+            def _cleanup(t: asyncio.Task, key: str = key) -> None:
+                self._inflight.pop(key, None)
+                if not t.cancelled():
+                    t.exception()  # mark retrieved for the all-waiters-gone case
+
+            task.add_done_callback(_cleanup)
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        fetch_fn: Callable[[dict], Awaitable[tuple[T, dict]]],
+        ttl: int,
+        entry: Optional[CacheEntry],
+    ) -> T:
+        """Foreground fetch body shared by all singleflight waiters."""
+        try:
+            if entry:
+                logger.info(f"Cache expired for {key}, refetching...")
+            else:
+                logger.info(f"Cache miss for {key}, fetching...")
+
+            data, validators = await fetch_fn(entry.validators if entry else {})
+            self._store(key, data, ttl, validators)
+            return data
+
+        except FeedNotModifiedError:
+            # Remote unchanged: keep the data, reset the entry's age
+            logger.info(f"Remote unchanged for {key}, revalidated")
+            entry.touch()
+            return entry.data
+
+        except Exception as e:
+            # Serve stale if available and within grace period
+            if entry and entry.is_stale_but_usable:
+                logger.warning(
+                    f"Fetch failed for {key}, serving stale data "
+                    f"(age={entry.age_seconds:.1f}s): {e}"
+                )
+                return entry.data
+
+            # No usable cached data - waiters see the same failure
+            logger.error(f"Fetch failed for {key} with no usable cache: {e}")
+            raise
+
+    async def _background_refresh(
+        self, key: str, fetch_fn: Callable[[dict], Awaitable[tuple[T, dict]]], ttl: int
+    ):
+        """Refresh a stale entry off the request path; failures keep stale data."""
+        try:
+            entry = self._entries.get(key)
+            data, validators = await fetch_fn(entry.validators if entry else {})
+            self._store(key, data, ttl, validators)
+            logger.info(f"Background refresh complete for {key}")
+        except FeedNotModifiedError:
+            logger.info(f"Remote unchanged for {key}, revalidated")
+            if entry:
+                entry.touch()
+        except Exception as e:
+            # Keep serving the stale entry until it ages past the grace period
+            logger.warning(f"Background refresh failed for {key}: {e}")
+
+    def _store(self, key: str, data: Any, ttl: int, validators: dict):
+        """Insert/replace an entry at the LRU tail, evicting past budget."""
+        old = self._entries.pop(key, None)
+        if old:
+            self._total_bytes -= old.size_bytes
+        entry = CacheEntry(
+            data=data,
+            fetched_at=datetime.now(),
+            ttl_seconds=ttl,
+            validators=validators,
+            size_bytes=_estimate_size(data),
+        )
+        self._entries[key] = entry
+        self._total_bytes += entry.size_bytes
 
-                # No usable cached data
-                logger.error(f"Fetch failed for {key} with no usable cache: {e}")
-                raise
+        while self._total_bytes > config.max_cache_bytes:
+            victim = next(
+                (
+                    k
+                    for k in self._entries
+                    if k != key and k not in _PINNED_KEYS
+                ),
+                None,
+            )
+            if victim is None:
+                break
+            evicted = self._entries.pop(victim)
+            self._total_bytes -= evicted.size_bytes
+            logger.info(
+                f"Cache evicted {victim} "
+                f"({evicted.size_bytes} bytes, total={self._total_bytes})"
+            )
 
     def get_entry_info(self, key: str) -> Optional[dict]:
         """Get metadata about a cache entry."""
@@ -111,9 +254,10 @@ class FeedCache:
         """Invalidate specific key or all cache."""
         if key is None:
             self._entries.clear()
+            self._total_bytes = 0
             logger.info("Cache cleared")
         elif key in self._entries:
-            del self._entries[key]
+            self._total_bytes -= self._entries.pop(key).size_bytes
             logger.info(f"Cache invalidated for {key}")
 
     def keys(self) -> list[str]:
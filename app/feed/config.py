@@ -13,6 +13,7 @@ class FeedConfig:
     http_timeout_seconds: int
     stale_grace_seconds: int
     max_partitions: int
+    max_cache_bytes: int
 
     @classmethod
     def from_env(cls) -> "FeedConfig":
@@ -26,6 +27,9 @@ class FeedConfig:
             http_timeout_seconds=int(os.getenv("FEED_HTTP_TIMEOUT_SECONDS", "30")),
             stale_grace_seconds=int(os.getenv("FEED_STALE_GRACE_SECONDS", "300")),
             max_partitions=int(os.getenv("FEED_MAX_PARTITIONS", "14")),
+            # Cache memory budget (estimated payload bytes); old partition
+            # entries are evicted LRU-first past this. 256 MB default
+            max_cache_bytes=int(os.getenv("FEED_MAX_CACHE_BYTES", "268435456")),
         )
 
 
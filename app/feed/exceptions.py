@@ -17,3 +17,12 @@ class FeedUnavailableError(FeedError):
 class FeedParseError(FeedError):
     """Raised when feed data cannot be parsed."""
     pass
+
+
+class FeedNotModifiedError(FeedError):
+    """Raised when a conditional fetch returns 304 Not Modified.
+
+    Signals the cache to keep its current data and just reset the entry's
+    age; never propagates to request handlers.
+    """
+    pass
@@ -1,13 +1,35 @@
 """In-memory data store with indexes for efficient queries."""
 
 import logging
-from collections import defaultdict
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import islice
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on recycled MatchRecord instances kept between refreshes
+_MATCH_POOL_CAP = 100_000
+
+
+def _intern_str(value: object) -> object:
+    """Intern a string value, passing non-strings through unchanged.
+
+    Feed payloads repeat the same handful of class/state/win_type strings
+    (and champion names) across thousands of matches; interning collapses
+    each to one shared object, cutting resident memory and making the
+    equality checks in the aggregate rebuilds pointer comparisons.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class MatchRecord:
     """Normalized match record from feed."""
@@ -20,6 +42,192 @@ class MatchRecord:
     players: list[dict]
     performances: list[dict]
 
+    @cached_property
+    def perf_map(self) -> dict[int, dict]:
+        """token_id -> performance row, built lazily on first access.
+
+        Analysis code looks up performances per player for every match;
+        caching the dict here avoids rebuilding it on each pass.
+        """
+        return {p["token_id"]: p for p in self.performances if p.get("token_id")}
+
+    @cached_property
+    def champion_rows(self) -> list[tuple]:
+        """(token_id, name, class, team) per champion, built on first access.
+
+        The aggregate rebuilds re-walk every player dict of every match just
+        to find the two champions; this keeps them as small tuples so those
+        passes skip the is_champion/.get probing per player.
+        """
+        return [
+            (p.get("token_id"), p.get("name", ""), p.get("class", ""), p.get("team"))
+            for p in self.players
+            if p.get("is_champion")
+        ]
+
+    @cached_property
+    def team_rosters(self) -> tuple[dict[int, dict], dict[int, list[dict]]]:
+        """(champion by team, supporters by team), built lazily on first access.
+
+        Every query path splits ``players`` into champions and supporters per
+        team; caching the split on the record plays the role a covering index
+        would in SQL - repeat reads skip the per-player scan.
+        """
+        champions: dict[int, dict] = {}
+        supporters: dict[int, list[dict]] = {1: [], 2: []}
+        for player in self.players:
+            team = player.get("team")
+            if team not in supporters:
+                continue
+            if player.get("is_champion"):
+                champions[team] = player
+            else:
+                supporters[team].append(player)
+        return champions, supporters
+
+    @cached_property
+    def champion_teams(self) -> dict[int, int]:
+        """champion token_id -> team, built lazily on first access.
+
+        Answers "which side is this champion on" with one dict probe
+        instead of scanning the roster split per match.
+        """
+        champions, _ = self.team_rosters
+        return {
+            champ.get("token_id"): team for team, champ in champions.items()
+        }
+
+
+class PointInTimeIndex:
+    """Running point-in-time stats built once per ingest.
+
+    The store's ``*_before_date`` helpers rescan a token's full match history
+    on every call, which makes the historical loop O(N^2) — three scans per
+    perspective plus one per supporter. This index walks the scored matches
+    once, recording per-token totals per cutoff date, so each lookup becomes
+    a binary search for "last entry strictly before this date". Scored
+    history is immutable, so the rollup never needs invalidation — it is
+    simply rebuilt with the rest of the aggregates when new data arrives.
+    """
+
+    def __init__(self, store: "FeedDataStore") -> None:
+        # The distinct scored dates are the only cutoffs ever queried; for a
+        # rolling feed window this is a handful of values, so per-token totals
+        # per cutoff stay effectively linear in the number of performances.
+        self._dates: list[str] = sorted(
+            {store.matches[m].match_date for m in store.scored_matches}
+        )
+        # token_id -> totals[j] = stats strictly before self._dates[j]
+        # (one extra trailing entry covers cutoffs past the last date).
+        self._perf: dict[int, list] = {}
+        self._champ: dict[int, list] = {}
+        self._moki: dict[int, list] = {}
+
+        for token_id, match_ids in store.matches_by_token.items():
+            # Collect this token's scored games in store order, matching the
+            # per-call scan (and its float summation order) exactly
+            perf_rows: list[tuple[str, dict]] = []
+            champ_rows: list[tuple[str, bool]] = []
+            moki_rows: list[tuple[str, bool]] = []
+
+            for match_id in match_ids:
+                match = store.matches.get(match_id)
+                if not match or match.state != "scored":
+                    continue
+                date = match.match_date
+
+                perf = match.perf_map.get(token_id)
+                if perf:
+                    perf_rows.append((date, perf))
+
+                for player in match.players:
+                    if player.get("token_id") == token_id:
+                        won = match.team_won == player.get("team")
+                        moki_rows.append((date, won))
+                        if player.get("is_champion"):
+                            champ_rows.append((date, won))
+                        break
+
+            cutoffs = self._dates + ["~"]  # sorts after any YYYY-MM-DD
+
+            if perf_rows:
+                self._perf[token_id] = [
+                    self._sum_perf(perf_rows, cutoff) for cutoff in cutoffs
+                ]
+            if moki_rows:
+                self._moki[token_id] = [
+                    self._sum_wins(moki_rows, cutoff) for cutoff in cutoffs
+                ]
+            if champ_rows:
+                self._champ[token_id] = [
+                    self._sum_wins(champ_rows, cutoff) for cutoff in cutoffs
+                ]
+
+    @staticmethod
+    def _sum_perf(
+        rows: list[tuple[str, dict]], cutoff: str
+    ) -> tuple[float, float, float, int]:
+        elims, deps, wart, count = 0.0, 0.0, 0.0, 0
+        for date, perf in rows:
+            if date >= cutoff:
+                continue
+            elims += perf.get("eliminations", 0) or 0
+            deps += perf.get("deposits", 0) or 0
+            wart += perf.get("wart_distance", 0) or 0
+            count += 1
+        return elims, deps, wart, count
+
+    @staticmethod
+    def _sum_wins(rows: list[tuple[str, bool]], cutoff: str) -> tuple[int, int]:
+        wins, games = 0, 0
+        for date, won in rows:
+            if date >= cutoff:
+                continue
+            games += 1
+            if won:
+                wins += 1
+        return wins, games
+
+    def _totals_before(
+        self, index: dict[int, list[tuple]], token_id: int, before_date: str
+    ) -> Optional[tuple]:
+        totals = index.get(token_id)
+        if totals is None:
+            return None
+        # totals[j] holds stats before self._dates[j]; the subset of games
+        # before an arbitrary date equals the subset before the first
+        # recorded date >= it (or everything, for the trailing entry)
+        return totals[bisect_left(self._dates, before_date)]
+
+    def get_career_stats_before_date(self, token_id: int, before_date: str) -> dict:
+        """Mirror of ``FeedDataStore.get_career_stats_before_date``."""
+        totals = self._totals_before(self._perf, token_id, before_date)
+        if totals and totals[3] > 0:
+            elims, deps, wart, count = totals
+            return {
+                "career_elims": elims / count,
+                "career_deps": deps / count,
+                "career_wart": wart / count,
+            }
+        return {"career_elims": 1.0, "career_deps": 1.5, "career_wart": 0.0}
+
+    def get_champion_winrate_before_date(self, token_id: int, before_date: str) -> float:
+        """Mirror of ``FeedDataStore.get_champion_winrate_before_date``."""
+        totals = self._totals_before(self._champ, token_id, before_date)
+        if totals and totals[1] > 0:
+            wins, games = totals
+            return round(100 * wins / games, 1)
+        return 50.0
+
+    def get_moki_winrate_before_date(self, token_id: int, before_date: str) -> float:
+        """Mirror of ``FeedDataStore.get_moki_winrate_before_date``."""
+        totals = self._totals_before(self._moki, token_id, before_date)
+        if totals:
+            wins, games = totals
+            if games >= 5:  # Minimum games threshold
+                return round(100 * wins / games, 1)
+        return 50.0
+
 
 @dataclass
 class FeedDataStore:
@@ -48,8 +256,39 @@ class FeedDataStore:
         default_factory=lambda: defaultdict(list)
     )  # token_id -> [(match_date, class), ...]
 
-    def clear(self):
+    # Monotonic data version, bumped on every aggregate rebuild (i.e. after
+    # each feed ingest); lets query-layer caches detect new data cheaply
+    version: int = 0
+
+    # Point-in-time rollup over scored matches, built with the aggregates
+    point_in_time: Optional[PointInTimeIndex] = None
+
+    # Date-sorted view of matches_by_token plus the parallel date lists
+    # (built in rebuild_aggregates); lets before-date scans bisect to the
+    # cutoff prefix instead of filtering the whole history. A separate view
+    # rather than an in-place sort: the load-order lists feed running sums
+    # elsewhere, and reordering them would perturb float summation order
+    _sorted_by_token: dict[int, list[str]] = field(default_factory=dict)
+    _dates_by_token: dict[int, list[str]] = field(default_factory=dict)
+
+    # SoA view of cumulative career averages (built in rebuild_aggregates):
+    # token -> dense index plus three parallel float arrays, so career
+    # lookups are contiguous indexed loads instead of dict-of-dict chasing
+    _token_idx: dict[int, int] = field(default_factory=dict)
+    _career_elims: Optional[np.ndarray] = None
+    _career_deps: Optional[np.ndarray] = None
+    _career_wart: Optional[np.ndarray] = None
+
+    # Freelist of MatchRecord instances recycled across refreshes; each
+    # refresh clears and rebuilds the whole store, so reusing the records
+    # avoids tens of thousands of allocations per cycle
+    _match_pool: list[MatchRecord] = field(default_factory=list, repr=False)
+
+    def clear(self) -> None:
         """Clear all data and indexes."""
+        free = _MATCH_POOL_CAP - len(self._match_pool)
+        if free > 0:
+            self._match_pool.extend(islice(self.matches.values(), free))
         self.matches.clear()
         self.cumulative_stats.clear()
         self.matches_by_date.clear()
@@ -59,42 +298,88 @@ class FeedDataStore:
         self.class_matchup_winrates.clear()
         self.champion_winrates.clear()
         self.class_history.clear()
-
-    def load_partition(self, partition_data: list[dict]):
+        self.point_in_time = None
+        self._sorted_by_token.clear()
+        self._dates_by_token.clear()
+        self._token_idx.clear()
+        self._career_elims = None
+        self._career_deps = None
+        self._career_wart = None
+
+    def load_partition(self, partition_data: list[dict]) -> None:
         """Load a partition into the store."""
-        loaded = 0
+        # Per-partition deltas; merged below with one update/extend per
+        # container so the shared dict and index lists grow in a few big
+        # steps instead of one realloc-prone insert per record
+        new_matches: dict[str, MatchRecord] = {}
+        by_date: dict[str, list[str]] = defaultdict(list)
+        by_token: dict[int, list[str]] = defaultdict(list)
+        scheduled: list[str] = []
+        scored: list[str] = []
         for record in partition_data:
             match_obj = record.get("match", {})
             match_id = match_obj.get("match_id")
 
             if not match_id:
                 continue
-            if match_id in self.matches:
+            if match_id in self.matches or match_id in new_matches:
                 continue  # Already loaded
 
-            match_record = MatchRecord(
+            players = record.get("players", [])
+            for player in players:
+                player["name"] = _intern_str(player.get("name", ""))
+                player["class"] = _intern_str(player.get("class", ""))
+
+            match_record = self._new_match_record(
                 match_id=match_id,
-                match_date=match_obj.get("match_date", ""),
+                match_date=_intern_str(match_obj.get("match_date", "")),
                 team_won=match_obj.get("team_won"),
-                win_type=match_obj.get("win_type"),
-                state=match_obj.get("state", ""),
-                players=record.get("players", []),
+                win_type=_intern_str(match_obj.get("win_type")),
+                state=_intern_str(match_obj.get("state", "")),
+                players=players,
                 performances=record.get("performances", []),
             )
-            self.matches[match_id] = match_record
-            self._index_match(match_record)
-            loaded += 1
+            new_matches[match_id] = match_record
+            self._index_match(match_record, by_date, by_token, scheduled, scored)
+
+        self.matches.update(new_matches)
+        for match_date, match_ids in by_date.items():
+            self.matches_by_date[match_date].extend(match_ids)
+        for token_id, match_ids in by_token.items():
+            self.matches_by_token[token_id].extend(match_ids)
+        self.scheduled_matches.extend(scheduled)
+        self.scored_matches.extend(scored)
 
-        logger.info(f"Loaded {loaded} new matches from partition")
+        logger.info(f"Loaded {len(new_matches)} new matches from partition")
 
-    def _index_match(self, match: MatchRecord):
-        """Build indexes for a match."""
-        self.matches_by_date[match.match_date].append(match.match_id)
+    def _new_match_record(self, **fields) -> MatchRecord:
+        """Build a MatchRecord, recycling a pooled instance when available.
+
+        Clearing __dict__ before reassigning also drops any cached_property
+        values (perf_map etc.) left over from the record's previous life.
+        """
+        if self._match_pool:
+            record = self._match_pool.pop()
+            record.__dict__.clear()
+            record.__dict__.update(fields)
+            return record
+        return MatchRecord(**fields)
+
+    def _index_match(
+        self,
+        match: MatchRecord,
+        by_date: dict[str, list[str]],
+        by_token: dict[int, list[str]],
+        scheduled: list[str],
+        scored: list[str],
+    ) -> None:
+        """Index a match into the caller's per-partition index deltas."""
+        by_date[match.match_date].append(match.match_id)
 
         for player in match.players:
             token_id = player.get("token_id")
             if token_id:
-                self.matches_by_token[token_id].append(match.match_id)
+                by_token[token_id].append(match.match_id)
 
             # Track class history for champions (scored matches only)
             if player.get("is_champion") and token_id and match.state == "scored":
@@ -103,11 +388,11 @@ class FeedDataStore:
                     self.class_history[token_id].append((match.match_date, player_class))
 
         if match.state == "scheduled":
-            self.scheduled_matches.append(match.match_id)
+            scheduled.append(match.match_id)
         elif match.state == "scored":
-            self.scored_matches.append(match.match_id)
+            scored.append(match.match_id)
 
-    def load_cumulative(self, cumulative_data: list[dict]):
+    def load_cumulative(self, cumulative_data: list[dict]) -> None:
         """Load cumulative stats."""
         for record in cumulative_data:
             token_id = record.get("token_id")
@@ -132,49 +417,113 @@ class FeedDataStore:
                 }
         logger.info(f"Loaded cumulative stats for {len(cumulative_data)} players")
 
-    def rebuild_aggregates(self):
+    def rebuild_aggregates(self) -> None:
         """Rebuild pre-computed aggregates from loaded data."""
         logger.info("Rebuilding aggregate statistics...")
+        self.version += 1
+        self._finalize_indexes()
+        self._finalize_career_arrays()
         self._compute_champion_winrates()
         self._compute_class_matchups()
+        self.point_in_time = PointInTimeIndex(self)
         logger.info(
             f"Aggregates built: {len(self.champion_winrates)} champions, "
             f"{len(self.class_matchup_winrates)} class matchups"
         )
 
-    def _compute_champion_winrates(self):
+    def _finalize_indexes(self) -> None:
+        """Build the date-sorted per-token view for prefix queries.
+
+        The sort is stable, so matches on the same date keep load order.
+        """
+        for token_id, match_ids in self.matches_by_token.items():
+            sorted_ids = sorted(match_ids, key=lambda m: self.matches[m].match_date)
+            self._sorted_by_token[token_id] = sorted_ids
+            self._dates_by_token[token_id] = [
+                self.matches[m].match_date for m in sorted_ids
+            ]
+
+    def _finalize_career_arrays(self) -> None:
+        """Build the SoA career-average arrays from cumulative stats."""
+        n = len(self.cumulative_stats)
+        self._token_idx = {
+            token_id: i for i, token_id in enumerate(self.cumulative_stats)
+        }
+        self._career_elims = np.fromiter(
+            (s["avg_elims"] for s in self.cumulative_stats.values()),
+            dtype=np.float64,
+            count=n,
+        )
+        self._career_deps = np.fromiter(
+            (s["avg_deps"] for s in self.cumulative_stats.values()),
+            dtype=np.float64,
+            count=n,
+        )
+        self._career_wart = np.fromiter(
+            (s["avg_wart"] for s in self.cumulative_stats.values()),
+            dtype=np.float64,
+            count=n,
+        )
+
+    def _matches_before_date(self, token_id: int, before_date: str) -> list[str]:
+        """Match ids for a token strictly before a date.
+
+        Bisects the sorted per-token dates when available; otherwise falls
+        back to the full (unordered) list for the caller to filter.
+        """
+        dates = self._dates_by_token.get(token_id)
+        if dates is None:
+            return self.matches_by_token.get(token_id, [])
+        return self._sorted_by_token[token_id][: bisect_left(dates, before_date)]
+
+    def _compute_champion_winrates(self) -> None:
         """Compute champion win rates from scored matches."""
         champ_stats: dict[int, dict] = defaultdict(
             lambda: {"wins": 0, "games": 0, "name": "", "class": ""}
         )
 
-        # First, collect champion info from ALL matches (including scheduled)
-        # This ensures we have name/class even if no scored matches exist
-        for match_id, match in self.matches.items():
-            for player in match.players:
-                if player.get("is_champion"):
-                    token_id = player.get("token_id")
-                    if token_id and not champ_stats[token_id]["name"]:
-                        champ_stats[token_id]["name"] = player.get("name", "")
-                        champ_stats[token_id]["class"] = player.get("class", "")
-
-        # Then compute win rates from scored matches only
-        for match_id in self.scored_matches:
-            match = self.matches[match_id]
-            for player in match.players:
-                if player.get("is_champion"):
-                    token_id = player["token_id"]
-                    team = player["team"]
-                    won = match.team_won == team
-
-                    champ_stats[token_id]["games"] += 1
-                    if won:
-                        champ_stats[token_id]["wins"] += 1
-                    # Update name/class in case we have better info from scored match
-                    if player.get("name"):
-                        champ_stats[token_id]["name"] = player.get("name", "")
-                    if player.get("class"):
-                        champ_stats[token_id]["class"] = player.get("class", "")
+        # Single pass over ALL matches (including scheduled): name/class are
+        # seeded on first sight so champions with no scored games still
+        # resolve, scored rows refresh them (later scored info wins, since
+        # champions can change class). Win/game counting moves to typed
+        # buffers so the per-champion totals reduce to two bincounts below
+        tok_buf = array("q")
+        won_buf = array("b")
+        for match in self.matches.values():
+            scored = match.state == "scored"
+            for token_id, name, player_class, team in match.champion_rows:
+                if not token_id and not scored:
+                    continue
+                stats = champ_stats[token_id]
+                if token_id and not stats["name"]:
+                    stats["name"] = name
+                    stats["class"] = player_class
+                if scored:
+                    if type(token_id) is int:
+                        tok_buf.append(token_id)
+                        won_buf.append(match.team_won == team)
+                    else:
+                        stats["games"] += 1
+                        if match.team_won == team:
+                            stats["wins"] += 1
+                    # Update name/class in case scored match has better info
+                    if name:
+                        stats["name"] = name
+                    if player_class:
+                        stats["class"] = player_class
+
+        if tok_buf:
+            toks = np.frombuffer(tok_buf, dtype=np.int64)
+            wons = np.frombuffer(won_buf, dtype=np.int8)
+            # Token ids are sparse, so map them to dense indices first
+            # rather than bincounting over the raw id range
+            uniq, inv = np.unique(toks, return_inverse=True)
+            games = np.bincount(inv)
+            wins = np.bincount(inv, weights=wons).astype(np.int64)
+            for token_id, g, w in zip(uniq.tolist(), games.tolist(), wins.tolist()):
+                stats = champ_stats[token_id]
+                stats["games"] = g
+                stats["wins"] = w
 
         self.champion_winrates = {
             token_id: {
@@ -188,33 +537,37 @@ class FeedDataStore:
             for token_id, stats in champ_stats.items()
         }
 
-    def _compute_class_matchups(self):
+    def _compute_class_matchups(self) -> None:
         """Compute class vs class win rates."""
-        matchup_stats: dict[tuple[str, str], dict] = defaultdict(
-            lambda: {"wins": 0, "games": 0}
-        )
 
-        for match_id in self.scored_matches:
-            match = self.matches[match_id]
-            champions = [p for p in match.players if p.get("is_champion")]
-            if len(champions) != 2:
-                continue
+        # The class alphabet is tiny, so instead of two dict-entry updates
+        # per match we stream (my_class, opp_class, won) keys into a Counter
+        # (C-level counting loop) and fold the handful of distinct triples
+        # into wins/games afterwards
+        def pair_keys():
+            for match_id in self.scored_matches:
+                match = self.matches[match_id]
+                champions = match.champion_rows
+                if len(champions) != 2:
+                    continue
 
-            c1, c2 = champions
-            if c1["team"] > c2["team"]:
-                c1, c2 = c2, c1  # Ensure consistent team ordering
+                c1, c2 = champions
+                if c1[3] > c2[3]:
+                    c1, c2 = c2, c1  # Ensure consistent team ordering
 
-            # c1 vs c2
-            key1 = (c1.get("class", ""), c2.get("class", ""))
-            matchup_stats[key1]["games"] += 1
-            if match.team_won == c1["team"]:
-                matchup_stats[key1]["wins"] += 1
+                yield (c1[2], c2[2], match.team_won == c1[3])
+                yield (c2[2], c1[2], match.team_won == c2[3])
 
-            # c2 vs c1
-            key2 = (c2.get("class", ""), c1.get("class", ""))
-            matchup_stats[key2]["games"] += 1
-            if match.team_won == c2["team"]:
-                matchup_stats[key2]["wins"] += 1
+        pair_counts = Counter(pair_keys())
+
+        matchup_stats: dict[tuple[str, str], dict] = defaultdict(
+            lambda: {"wins": 0, "games": 0}
+        )
+        for (my_class, opp_class, won), count in pair_counts.items():
+            stats = matchup_stats[(my_class, opp_class)]
+            stats["games"] += count
+            if won:
+                stats["wins"] += count
 
         # Only include matchups with enough games
         self.class_matchup_winrates = {
@@ -225,7 +578,16 @@ class FeedDataStore:
 
     def get_career_stats(self, token_id: int) -> dict:
         """Get career stats for a token from cumulative data."""
+        idx = self._token_idx.get(token_id)
+        if idx is not None:
+            # .item() keeps the API on plain Python floats
+            return {
+                "career_elims": self._career_elims[idx].item(),
+                "career_deps": self._career_deps[idx].item(),
+                "career_wart": self._career_wart[idx].item(),
+            }
         if token_id in self.cumulative_stats:
+            # Arrays not finalized yet (store loaded but aggregates pending)
             stats = self.cumulative_stats[token_id]
             return {
                 "career_elims": stats["avg_elims"],
@@ -238,11 +600,18 @@ class FeedDataStore:
     def get_career_stats_before_date(self, token_id: int, before_date: str) -> dict:
         """Get career stats using only performances before a specific date.
 
-        Required for point-in-time historical analysis.
+        Required for point-in-time historical analysis. Served from the
+        point-in-time rollup when aggregates are built; the scan below is
+        the fallback for a store that has not been finalized yet.
         """
+        if self.point_in_time is not None:
+            return self.point_in_time.get_career_stats_before_date(
+                token_id, before_date
+            )
+
         elims, deps, wart, count = 0.0, 0.0, 0.0, 0
 
-        for match_id in self.matches_by_token.get(token_id, []):
+        for match_id in self._matches_before_date(token_id, before_date):
             match = self.matches.get(match_id)
             if not match or match.match_date >= before_date:
                 continue
@@ -267,19 +636,25 @@ class FeedDataStore:
     def get_champion_winrate_before_date(self, token_id: int, before_date: str) -> float:
         """Get champion win rate using only matches before a specific date.
 
-        Required for point-in-time historical analysis.
+        Required for point-in-time historical analysis. Served from the
+        point-in-time rollup when aggregates are built.
         """
+        if self.point_in_time is not None:
+            return self.point_in_time.get_champion_winrate_before_date(
+                token_id, before_date
+            )
+
         wins, games = 0, 0
 
-        for match_id in self.matches_by_token.get(token_id, []):
+        for match_id in self._matches_before_date(token_id, before_date):
             match = self.matches.get(match_id)
             if not match or match.state != "scored" or match.match_date >= before_date:
                 continue
 
-            for player in match.players:
-                if player.get("token_id") == token_id and player.get("is_champion"):
+            for tid, _name, _class, team in match.champion_rows:
+                if tid == token_id:
                     games += 1
-                    if match.team_won == player["team"]:
+                    if match.team_won == team:
                         wins += 1
                     break
 
@@ -301,10 +676,16 @@ class FeedDataStore:
         """Get win rate for any moki using only matches before a specific date.
 
         Required for point-in-time historical analysis of supporters.
+        Served from the point-in-time rollup when aggregates are built.
         """
+        if self.point_in_time is not None:
+            return self.point_in_time.get_moki_winrate_before_date(
+                token_id, before_date
+            )
+
         wins, games = 0, 0
 
-        for match_id in self.matches_by_token.get(token_id, []):
+        for match_id in self._matches_before_date(token_id, before_date):
             match = self.matches.get(match_id)
             if not match or match.state != "scored" or match.match_date >= before_date:
                 continue
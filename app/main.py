@@ -1,16 +1,19 @@
 """FastAPI application for Grand Arena Contest Tool."""
 
 import logging
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import FileResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
-from .feed import FeedCoordinator, FeedUnavailableError
+from .feed import FeedCoordinator, FeedUnavailableError, get_feed
+from .queries.blocks import get_current_block, get_utc_today
 from .queries import (
     get_champion_matchups,
     get_class_changes,
@@ -45,7 +48,66 @@ async def lifespan(app: FastAPI):
     await feed.shutdown()
 
 
-app = FastAPI(title="Grand Arena Contest Tool", lifespan=lifespan)
+# orjson encodes the float-heavy payloads in C, several times faster than
+# the stdlib json path behind the default JSONResponse
+app = FastAPI(
+    title="Grand Arena Contest Tool",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Pre-serialized JSON bodies per endpoint, valid for one stamp of
+# (feed version, day, block, query params). The feed only changes on
+# refresh, so steady-state requests skip both the aggregation and the
+# JSON encode and reduce to a dict probe plus a raw Response.
+# Keys embed client-supplied query params, so the cache is LRU-bounded
+# by a byte budget (same shape as FeedCache) - a client sweeping
+# distinct param values can't retain more than the budget
+_response_cache: OrderedDict[tuple, tuple[tuple, bytes]] = OrderedDict()
+_response_cache_bytes = 0
+_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of serialized bodies
+
+
+async def _cached_json(name: str, params: tuple, compute, request: Request) -> Response:
+    """Serve an endpoint from the version-keyed response cache.
+
+    ``compute`` is the zero-arg async query; it only runs when the stamp
+    changed. Emits a weak ETag derived from the stamp and answers
+    If-None-Match with a bodyless 304.
+    """
+    global _response_cache_bytes
+
+    feed = await get_feed()
+    stamp = (feed.store.version, get_utc_today(), get_current_block(), params)
+    key = (name, params)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        _response_cache.move_to_end(key)
+    if cached is None or cached[0] != stamp:
+        # OPT_SERIALIZE_NUMPY so stray numpy scalars from the vectorized
+        # query paths encode without a Python-side conversion
+        body = orjson.dumps(await compute(), option=orjson.OPT_SERIALIZE_NUMPY)
+        if cached is not None:
+            _response_cache_bytes -= len(cached[1])
+        cached = (stamp, body)
+        _response_cache[key] = cached
+        _response_cache.move_to_end(key)
+        _response_cache_bytes += len(body)
+        # Evict least-recently-served bodies past the budget, keeping at
+        # least the entry just produced
+        while _response_cache_bytes > _RESPONSE_CACHE_MAX_BYTES:
+            victim = next((k for k in _response_cache if k != key), None)
+            if victim is None:
+                break
+            _, victim_body = _response_cache.pop(victim)
+            _response_cache_bytes -= len(victim_body)
+
+    etag = f'W/"{name}:{":".join(str(part) for part in stamp)}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=cached[1], media_type="application/json", headers={"ETag": etag}
+    )
 
 # Serve static files
 static_dir = Path(__file__).parent / "static"
@@ -66,7 +128,7 @@ async def health():
 
 
 @app.get("/api/upcoming")
-async def api_upcoming(block: Optional[int] = Query(None, ge=1, le=3)):
+async def api_upcoming(request: Request, block: Optional[int] = Query(None, ge=1, le=3)):
     """Get all champions with their aggregated matchup scores for upcoming games.
 
     Args:
@@ -74,7 +136,12 @@ async def api_upcoming(block: Optional[int] = Query(None, ge=1, le=3)):
                calculated using only games in that block.
     """
     try:
-        return await get_upcoming_summary(block_filter=block)
+        return await _cached_json(
+            "upcoming",
+            (block,),
+            lambda: get_upcoming_summary(block_filter=block),
+            request,
+        )
     except FeedUnavailableError as e:
         logger.error(f"Feed unavailable for /api/upcoming: {e}")
         raise HTTPException(
@@ -108,10 +175,12 @@ async def api_champion_matchups(token_id: int, block: Optional[int] = Query(None
 
 
 @app.get("/api/analysis")
-async def api_analysis(limit: int = 50000):
+async def api_analysis(request: Request, limit: int = Query(50000, ge=1, le=50000)):
     """Get historical games with matchup scores for analysis."""
     try:
-        return await get_historical_analysis(limit)
+        return await _cached_json(
+            "analysis", (limit,), lambda: get_historical_analysis(limit), request
+        )
     except FeedUnavailableError as e:
         logger.error(f"Feed unavailable for /api/analysis: {e}")
         raise HTTPException(
@@ -122,10 +191,10 @@ async def api_analysis(limit: int = 50000):
 
 
 @app.get("/api/schemes")
-async def api_schemes():
+async def api_schemes(request: Request):
     """Get champions with their matching schemes and MS data."""
     try:
-        return await get_schemes_data()
+        return await _cached_json("schemes", (), get_schemes_data, request)
     except FeedUnavailableError as e:
         logger.error(f"Feed unavailable for /api/schemes: {e}")
         raise HTTPException(
@@ -136,10 +205,10 @@ async def api_schemes():
 
 
 @app.get("/api/class-changes")
-async def api_class_changes():
+async def api_class_changes(request: Request):
     """Get champions that have changed class."""
     try:
-        return await get_class_changes()
+        return await _cached_json("class-changes", (), get_class_changes, request)
     except FeedUnavailableError as e:
         logger.error(f"Feed unavailable for /api/class-changes: {e}")
         raise HTTPException(
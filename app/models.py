@@ -1,40 +1,28 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChampionSummary(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     token_id: int
     name: str
-    class_: str  # 'class' is reserved in Python
+    # 'class' is reserved in Python; the alias keeps JSON output as "class"
+    class_: str = Field(alias="class", serialization_alias="class")
     base_win_rate: float
     games: int
     avg_score: float
     favorable: int
     unfavorable: int
 
-    class Config:
-        populate_by_name = True
-
-    def model_dump(self, **kwargs):
-        d = super().model_dump(**kwargs)
-        # Rename class_ back to class for JSON output
-        d['class'] = d.pop('class_')
-        return d
-
 
 class Supporter(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     name: str
-    class_: str
+    class_: str = Field(alias="class", serialization_alias="class")
     career_elims: float
     career_deps: float
 
-    class Config:
-        populate_by_name = True
-
-    def model_dump(self, **kwargs):
-        d = super().model_dump(**kwargs)
-        d['class'] = d.pop('class_')
-        return d
-
 
 class Matchup(BaseModel):
     date: str
@@ -52,19 +40,13 @@ class Matchup(BaseModel):
 
 
 class Champion(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     token_id: int
     name: str
-    class_: str
+    class_: str = Field(alias="class", serialization_alias="class")
     base_win_rate: float
 
-    class Config:
-        populate_by_name = True
-
-    def model_dump(self, **kwargs):
-        d = super().model_dump(**kwargs)
-        d['class'] = d.pop('class_')
-        return d
-
 
 class ChampionMatchups(BaseModel):
     champion: dict
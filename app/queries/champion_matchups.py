@@ -1,7 +1,10 @@
 """Get detailed matchups for a specific champion."""
 
+from operator import itemgetter
 from typing import Optional
 
+import numpy as np
+
 from ..feed import get_feed
 from .scoring import calc_matchup_score, get_grade
 from .scoring_v4 import calc_composition_score
@@ -46,6 +49,33 @@ async def get_champion_matchups(token_id: int, block_filter: int = None) -> Opti
 
     matchups = []
 
+    # Supporters recur across a champion's matches; resolve each token's
+    # career numbers and win rate once for the whole loop
+    supp_stats_cache: dict[int, tuple] = {}
+
+    def _supporter_detail(s: dict) -> dict:
+        supp_token = s["token_id"]
+        cached = supp_stats_cache.get(supp_token)
+        if cached is None:
+            stats = store.get_career_stats(supp_token)
+            cached = (
+                round(stats["career_elims"], 2),
+                round(stats["career_deps"], 2),
+                round(stats["career_wart"], 2),
+                store.get_moki_winrate(supp_token),
+            )
+            supp_stats_cache[supp_token] = cached
+        career_elims, career_deps, career_wart, win_rate = cached
+        return {
+            "token_id": supp_token,
+            "name": s.get("name", ""),
+            "class": s.get("class", ""),
+            "career_elims": career_elims,
+            "career_deps": career_deps,
+            "career_wart": career_wart,
+            "win_rate": win_rate,
+        }
+
     # Find all scheduled matches for this champion (today and future only)
     for match_id in store.matches_by_token.get(token_id, []):
         match = store.matches.get(match_id)
@@ -60,34 +90,19 @@ async def get_champion_matchups(token_id: int, block_filter: int = None) -> Opti
         if block_filter and block != block_filter:
             continue
 
-        # Find champion's team and opponent
-        my_team = None
-        opp_team = None
-        my_champ = None
-        opp_champ = None
-        my_supporters = []
-        opp_supporters = []
-
-        for player in match.players:
-            if player.get("token_id") == token_id and player.get("is_champion"):
-                my_team = player.get("team")
-                my_champ = player
-
+        # Find champion's team and opponent (cached roster split plus the
+        # cached token -> team map, so no per-match scanning)
+        my_team = match.champion_teams.get(token_id)
         if my_team is None:
             continue
 
-        opp_team = 2 if my_team == 1 else 1
+        champions, supporters_by_team = match.team_rosters
+        my_champ = champions[my_team]
 
-        for player in match.players:
-            team = player.get("team")
-            if player.get("is_champion"):
-                if team == opp_team:
-                    opp_champ = player
-            else:
-                if team == my_team:
-                    my_supporters.append(player)
-                elif team == opp_team:
-                    opp_supporters.append(player)
+        opp_team = 2 if my_team == 1 else 1
+        opp_champ = champions.get(opp_team)
+        my_supporters = supporters_by_team[my_team]
+        opp_supporters = supporters_by_team[opp_team]
 
         if not opp_champ:
             continue
@@ -102,60 +117,32 @@ async def get_champion_matchups(token_id: int, block_filter: int = None) -> Opti
         opp_class = opp_champ.get("class", "")
         class_matchup = store.get_class_matchup(my_class, opp_class)
 
-        # Get supporter stats with details
-        my_supp_details = []
-        for s in my_supporters:
-            if s.get("token_id"):
-                stats = store.get_career_stats(s["token_id"])
-                my_supp_details.append(
-                    {
-                        "token_id": s["token_id"],
-                        "name": s.get("name", ""),
-                        "class": s.get("class", ""),
-                        "career_elims": round(stats["career_elims"], 2),
-                        "career_deps": round(stats["career_deps"], 2),
-                        "career_wart": round(stats["career_wart"], 2),
-                        "win_rate": store.get_moki_winrate(s["token_id"]),
-                    }
-                )
-
-        opp_supp_details = []
-        for s in opp_supporters:
-            if s.get("token_id"):
-                stats = store.get_career_stats(s["token_id"])
-                opp_supp_details.append(
-                    {
-                        "token_id": s["token_id"],
-                        "name": s.get("name", ""),
-                        "class": s.get("class", ""),
-                        "career_elims": round(stats["career_elims"], 2),
-                        "career_deps": round(stats["career_deps"], 2),
-                        "career_wart": round(stats["career_wart"], 2),
-                        "win_rate": store.get_moki_winrate(s["token_id"]),
-                    }
-                )
-
-        # Calculate averages
-        my_avg_elims = (
-            sum(s["career_elims"] for s in my_supp_details) / len(my_supp_details)
-            if my_supp_details
-            else 1.0
-        )
-        my_avg_deps = (
-            sum(s["career_deps"] for s in my_supp_details) / len(my_supp_details)
-            if my_supp_details
-            else 1.5
-        )
-        opp_avg_elims = (
-            sum(s["career_elims"] for s in opp_supp_details) / len(opp_supp_details)
-            if opp_supp_details
-            else 1.0
-        )
-        opp_avg_deps = (
-            sum(s["career_deps"] for s in opp_supp_details) / len(opp_supp_details)
-            if opp_supp_details
-            else 1.5
-        )
+        # Get supporter stats with details (per-token lookups memoized)
+        my_supp_details = [
+            _supporter_detail(s) for s in my_supporters if s.get("token_id")
+        ]
+        opp_supp_details = [
+            _supporter_detail(s) for s in opp_supporters if s.get("token_id")
+        ]
+
+        # Calculate averages: one vectorized mean per side instead of four
+        # generator-sum traversals over the detail dicts
+        if my_supp_details:
+            my_arr = np.array(
+                [(s["career_elims"], s["career_deps"]) for s in my_supp_details],
+                dtype=np.float64,
+            )
+            my_avg_elims, my_avg_deps = my_arr.mean(axis=0).tolist()
+        else:
+            my_avg_elims, my_avg_deps = 1.0, 1.5
+        if opp_supp_details:
+            opp_arr = np.array(
+                [(s["career_elims"], s["career_deps"]) for s in opp_supp_details],
+                dtype=np.float64,
+            )
+            opp_avg_elims, opp_avg_deps = opp_arr.mean(axis=0).tolist()
+        else:
+            opp_avg_elims, opp_avg_deps = 1.0, 1.5
 
         # V3.3 score (legacy)
         score = calc_matchup_score(
@@ -219,6 +206,11 @@ async def get_champion_matchups(token_id: int, block_filter: int = None) -> Opti
                 "opponent_win_rate": opp_win_rate,
                 "my_supporters": my_supp_details,
                 "opp_supporters": opp_supp_details,
+                # Per-supporter fields are rounded once per unique token in
+                # _supporter_detail; only these four per-match averages still
+                # round here. Keep builtin round(): it is correctly rounded,
+                # while np.round's scale-and-rint can differ in the last
+                # decimal and these values are part of the API payload
                 "my_avg_elims": round(my_avg_elims, 2),
                 "my_avg_deps": round(my_avg_deps, 2),
                 "opp_avg_elims": round(opp_avg_elims, 2),
@@ -233,8 +225,10 @@ async def get_champion_matchups(token_id: int, block_filter: int = None) -> Opti
             }
         )
 
-    # Sort by date, then by block, then by match_id (play order)
-    matchups.sort(key=lambda m: (m["date"], m.get("block", 0), m.get("match_id", "")))
+    # Sort by date, then by block, then by match_id (play order); every
+    # matchup dict carries all three keys, so itemgetter's C-level key
+    # extraction replaces the per-element lambda frame
+    matchups.sort(key=itemgetter("date", "block", "match_id"))
 
     return {
         "champion": champion,
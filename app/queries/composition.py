@@ -7,6 +7,8 @@ averaging supporter stats. Key patterns:
 - 2 elim specialists = Strong offense, denies opponent gacha
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal
 
 
@@ -79,10 +81,39 @@ def classify_supporter(stats: dict) -> dict:
     - Grade C Gacha: <1.5 deps/game
     - Wart Rider: >150 wart/game
     """
-    elims = stats.get("career_elims", 1.0)
-    deps = stats.get("career_deps", 1.5)
-    wart = stats.get("career_wart", 0)
+    (
+        elim_grade,
+        gacha_grade,
+        is_wart_rider,
+        primary_role,
+        career_elims,
+        career_deps,
+        career_wart,
+    ) = _classify_cached(
+        stats.get("career_elims", 1.0),
+        stats.get("career_deps", 1.5),
+        stats.get("career_wart", 0),
+    )
+    return {
+        "elim_grade": elim_grade,
+        "gacha_grade": gacha_grade,
+        "is_wart_rider": is_wart_rider,
+        "primary_role": primary_role,
+        "career_elims": career_elims,
+        "career_deps": career_deps,
+        "career_wart": career_wart,
+    }
 
+
+@lru_cache(maxsize=4096)
+def _classify_cached(elims: float, deps: float, wart: float) -> tuple:
+    """Memoized classification core, keyed by the three career stats.
+
+    The same supporter recurs across many matches within one request, so
+    repeat classifications hit the cache. Returns an immutable tuple;
+    classify_supporter builds a fresh dict per call so callers can mutate
+    their copy safely.
+    """
     elim_grade = get_elim_grade(elims)
     gacha_grade = get_gacha_grade(deps)
     is_wart_rider = wart >= WART_RIDER_THRESHOLD
@@ -101,15 +132,15 @@ def classify_supporter(stats: dict) -> dict:
     else:
         primary_role = "BALANCED"
 
-    return {
-        "elim_grade": elim_grade,
-        "gacha_grade": gacha_grade,
-        "is_wart_rider": is_wart_rider,
-        "primary_role": primary_role,
-        "career_elims": round(elims, 2),
-        "career_deps": round(deps, 2),
-        "career_wart": round(wart, 1),
-    }
+    return (
+        elim_grade,
+        gacha_grade,
+        is_wart_rider,
+        primary_role,
+        round(elims, 2),
+        round(deps, 2),
+        round(wart, 1),
+    )
 
 
 def detect_team_composition(supporters: list[dict], champion_class: str = "") -> dict:
@@ -137,13 +168,40 @@ def detect_team_composition(supporters: list[dict], champion_class: str = "") ->
     5. Wart focused
     6. Balanced
     """
-    # Classify each supporter
+    # Classify each supporter, then hand the branch logic to the memoized
+    # detector: team compositions repeat heavily across matches, so the
+    # same (role grades, champion class) key recurs within one request
     roles = [classify_supporter(s) for s in supporters]
+    role_keys = tuple(
+        (r["elim_grade"], r["gacha_grade"], r["primary_role"]) for r in roles
+    )
+    pattern, pattern_name, gacha_count, elim_count, wart_count, is_synergistic = (
+        _detect_cached(role_keys, champion_class)
+    )
+
+    return {
+        "pattern": pattern,
+        "pattern_name": pattern_name,
+        "roles": roles,
+        "gacha_count": gacha_count,
+        "elim_count": elim_count,
+        "wart_count": wart_count,
+        "is_synergistic": is_synergistic,
+        "champion_class": champion_class,
+    }
 
-    gacha_count = sum(1 for r in roles if r["primary_role"] == "GACHA")
-    elim_count = sum(1 for r in roles if r["primary_role"] == "ELIM")
-    wart_count = sum(1 for r in roles if r["primary_role"] == "WART")
-    hybrid_count = sum(1 for r in roles if r["primary_role"] == "HYBRID")
+
+@lru_cache(maxsize=4096)
+def _detect_cached(role_keys: tuple, champion_class: str) -> tuple:
+    """Memoized pattern detection over classified role tuples.
+
+    ``role_keys`` is one (elim_grade, gacha_grade, primary_role) triple
+    per supporter, in roster order.
+    """
+    gacha_count = sum(1 for _, _, role in role_keys if role == "GACHA")
+    elim_count = sum(1 for _, _, role in role_keys if role == "ELIM")
+    wart_count = sum(1 for _, _, role in role_keys if role == "WART")
+    hybrid_count = sum(1 for _, _, role in role_keys if role == "HYBRID")
 
     # Determine pattern
     pattern = "BALANCED"
@@ -152,7 +210,7 @@ def detect_team_composition(supporters: list[dict], champion_class: str = "") ->
     if gacha_count >= 2:
         # Double gacha - determine grade
         gacha_grades = sorted(
-            [r["gacha_grade"] for r in roles if r["primary_role"] == "GACHA"],
+            [g for _, g, role in role_keys if role == "GACHA"],
             reverse=True,
         )
         if len(gacha_grades) >= 2 and gacha_grades[0] == "A" and gacha_grades[1] == "A":
@@ -167,7 +225,7 @@ def detect_team_composition(supporters: list[dict], champion_class: str = "") ->
     elif elim_count >= 2:
         # Double elim - determine grade
         elim_grades = sorted(
-            [r["elim_grade"] for r in roles if r["primary_role"] == "ELIM"],
+            [e for e, _, role in role_keys if role == "ELIM"],
             reverse=True,
         )
         if len(elim_grades) >= 2 and elim_grades[0] == "A" and elim_grades[1] == "A":
@@ -205,21 +263,14 @@ def detect_team_composition(supporters: list[dict], champion_class: str = "") ->
     elif pattern.startswith("2E") and champion_class in ELIM_SYNERGY_CLASSES:
         is_synergistic = True
 
-    return {
-        "pattern": pattern,
-        "pattern_name": pattern_name,
-        "roles": roles,
-        "gacha_count": gacha_count,
-        "elim_count": elim_count,
-        "wart_count": wart_count,
-        "is_synergistic": is_synergistic,
-        "champion_class": champion_class,
-    }
+    return pattern, pattern_name, gacha_count, elim_count, wart_count, is_synergistic
 
 
-def get_pattern_display(pattern: str) -> dict:
-    """Get display info for a composition pattern."""
-    PATTERN_INFO = {
+# Display info per pattern, built once at import; get_pattern_display
+# hands out read-only views so the shared dicts can't be mutated
+_PATTERN_INFO = {
+    pattern: MappingProxyType(info)
+    for pattern, info in {
         "2G_AA": {
             "name": "2 Gacha (A+A)",
             "short": "2G-AA",
@@ -280,13 +331,18 @@ def get_pattern_display(pattern: str) -> dict:
             "color": "#888888",  # Gray
             "description": "No strong specialization",
         },
+    }.items()
+}
+
+
+def get_pattern_display(pattern: str) -> dict:
+    """Get display info for a composition pattern."""
+    info = _PATTERN_INFO.get(pattern)
+    if info is not None:
+        return info
+    return {
+        "name": pattern,
+        "short": pattern[:4],
+        "color": "#888888",
+        "description": "Unknown pattern",
     }
-    return PATTERN_INFO.get(
-        pattern,
-        {
-            "name": pattern,
-            "short": pattern[:4],
-            "color": "#888888",
-            "description": "Unknown pattern",
-        },
-    )
@@ -1,12 +1,19 @@
 """Historical analysis with point-in-time matchup scores."""
 
+import numpy as np
+
 from ..feed import get_feed
-from .scoring import calc_matchup_score
+from .scoring import CLASS_WEIGHTS, GACHA_CLASSES, calc_matchup_score_vec
 from .scoring_v4 import calc_composition_score, get_grade
 from .composition import detect_team_composition
 from .fantasy import calc_projected_fp, calc_actual_fp
 
 
+# V3.3 grade edges for np.digitize: F < 40 <= D < 50 <= C < 60 <= B < 70 <= A
+_GRADE_EDGES = (40, 50, 60, 70)
+_GRADE_NAMES = ("F", "D", "C", "B", "A")
+
+
 async def get_historical_analysis(limit: int = 50000) -> dict:
     """
     Analyze historical games with calculated matchup scores.
@@ -18,6 +25,9 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
     feed = await get_feed()
     store = feed.store
 
+    # Point-in-time rollup built at ingest with the other aggregates
+    pit = store.point_in_time
+
     games = []
     # Grade buckets for V3.3: A (70+), B (60-69), C (50-59), D (40-49), F (<40)
     grade_buckets = {
@@ -39,6 +49,20 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
     # FP tracking for summary stats
     fp_totals = {"proj_sum": 0.0, "actual_sum": 0.0, "count": 0}
 
+    # V3.3 score inputs gathered as SoA columns (one list per argument of
+    # calc_matchup_score_vec), scored in one vectorized batch after the
+    # scan instead of a scalar call per perspective
+    col_wr: list[float] = []
+    col_class_mu: list[float] = []
+    col_my_elims: list[float] = []
+    col_my_deps: list[float] = []
+    col_opp_elims: list[float] = []
+    col_opp_deps: list[float] = []
+    col_elim_w: list[float] = []
+    col_dep_w: list[float] = []
+    col_opp_gacha: list[bool] = []
+    pit_stats_rows: list[dict] = []
+
     # Sort scored matches by date descending
     sorted_matches = sorted(
         store.scored_matches,
@@ -53,22 +77,56 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
 
         match_date = match.match_date
 
-        # Get champions and supporters for each team
-        champions: dict[int, dict] = {}
-        supporters: dict[int, list] = {1: [], 2: []}
-
-        for player in match.players:
-            team = player.get("team")
-            if not team:
-                continue
-            if player.get("is_champion"):
-                champions[team] = player
-            else:
-                supporters[team].append(player)
+        # Get champions and supporters for each team (cached on the record)
+        champions, supporters = match.team_rosters
 
         if 1 not in champions or 2 not in champions:
             continue
 
+        # Per-team point-in-time supporter stats, averages, and info lists,
+        # computed once and shared by both perspectives below (each team is
+        # "mine" in one perspective and "theirs" in the other)
+        team_supp_stats: dict[int, list[dict]] = {}
+        team_avgs: dict[int, tuple[float, float]] = {}
+        team_supp_info: dict[int, list[dict]] = {}
+
+        for team in (1, 2):
+            supp_stats = [
+                pit.get_career_stats_before_date(s["token_id"], match_date)
+                for s in supporters[team]
+                if s.get("token_id")
+            ]
+            team_supp_stats[team] = supp_stats
+            team_avgs[team] = (
+                (
+                    sum(s["career_elims"] for s in supp_stats) / len(supp_stats)
+                    if supp_stats
+                    else 1.0
+                ),
+                (
+                    sum(s["career_deps"] for s in supp_stats) / len(supp_stats)
+                    if supp_stats
+                    else 1.5
+                ),
+            )
+
+            supp_info = []
+            for i, s in enumerate(supporters[team]):
+                if s.get("token_id"):
+                    stats = supp_stats[i] if i < len(supp_stats) else {}
+                    supp_info.append({
+                        "token_id": s.get("token_id"),
+                        "name": s.get("name", ""),
+                        "class": s.get("class", ""),
+                        "career_elims": round(stats.get("career_elims", 1.0), 2),
+                        "career_deps": round(stats.get("career_deps", 1.5), 2),
+                        "career_wart": round(stats.get("career_wart", 0), 1),
+                        "win_rate": pit.get_moki_winrate_before_date(
+                            s.get("token_id"), match_date
+                        ),
+                    })
+            team_supp_info[team] = supp_info
+
         # Calculate point-in-time stats for both perspectives
         for my_team, opp_team in [(1, 2), (2, 1)]:
             my_champ = champions[my_team]
@@ -79,60 +137,32 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
                 continue
 
             # Point-in-time win rate
-            my_wr = store.get_champion_winrate_before_date(my_token, match_date)
+            my_wr = pit.get_champion_winrate_before_date(my_token, match_date)
 
-            # Point-in-time supporter stats
-            my_supp_stats = [
-                store.get_career_stats_before_date(s["token_id"], match_date)
-                for s in supporters[my_team]
-                if s.get("token_id")
-            ]
-            opp_supp_stats = [
-                store.get_career_stats_before_date(s["token_id"], match_date)
-                for s in supporters[opp_team]
-                if s.get("token_id")
-            ]
-
-            my_avg_elims = (
-                sum(s["career_elims"] for s in my_supp_stats) / len(my_supp_stats)
-                if my_supp_stats
-                else 1.0
-            )
-            my_avg_deps = (
-                sum(s["career_deps"] for s in my_supp_stats) / len(my_supp_stats)
-                if my_supp_stats
-                else 1.5
-            )
-            opp_avg_elims = (
-                sum(s["career_elims"] for s in opp_supp_stats) / len(opp_supp_stats)
-                if opp_supp_stats
-                else 1.0
-            )
-            opp_avg_deps = (
-                sum(s["career_deps"] for s in opp_supp_stats) / len(opp_supp_stats)
-                if opp_supp_stats
-                else 1.5
-            )
+            # Point-in-time supporter stats (shared per-team computations)
+            my_supp_stats = team_supp_stats[my_team]
+            opp_supp_stats = team_supp_stats[opp_team]
+            my_avg_elims, my_avg_deps = team_avgs[my_team]
+            opp_avg_elims, opp_avg_deps = team_avgs[opp_team]
 
             # Class matchup (using all-time data, as per original)
             my_class = my_champ.get("class", "")
             opp_class = opp_champ.get("class", "")
             class_matchup = store.get_class_matchup(my_class, opp_class)
 
-            # V3.3 score (legacy)
-            score = calc_matchup_score(
-                my_wr,
-                class_matchup,
-                my_avg_elims,
-                my_avg_deps,
-                opp_avg_elims,
-                opp_avg_deps,
-                my_class,
-                opp_class,
-            )
+            # V3.3 score inputs (legacy) - batch-scored after the scan
+            elim_w, dep_w = CLASS_WEIGHTS.get(my_class, (12, -4))
+            col_wr.append(my_wr)
+            col_class_mu.append(class_matchup)
+            col_my_elims.append(my_avg_elims)
+            col_my_deps.append(my_avg_deps)
+            col_opp_elims.append(opp_avg_elims)
+            col_opp_deps.append(opp_avg_deps)
+            col_elim_w.append(elim_w)
+            col_dep_w.append(dep_w)
+            col_opp_gacha.append(opp_class in GACHA_CLASSES)
 
             won = match.team_won == my_team
-            score_rounded = round(score, 1)
 
             # V4 composition-based score
             score_v4, grade_v4, factors = calc_composition_score(
@@ -146,34 +176,15 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
             my_pattern = factors.get("my_pattern", "BALANCED")
             opp_pattern = factors.get("opp_pattern", "BALANCED")
 
-            # Update V3.3 grade buckets
-            if score_rounded >= 70:
-                grade = "A"
-            elif score_rounded >= 60:
-                grade = "B"
-            elif score_rounded >= 50:
-                grade = "C"
-            elif score_rounded >= 40:
-                grade = "D"
-            else:
-                grade = "F"
-
-            grade_buckets[grade]["total"] += 1
-            if won:
-                grade_buckets[grade]["wins"] += 1
-
             # Update V4 grade buckets
             grade_buckets_v4[grade_v4]["total"] += 1
             if won:
                 grade_buckets_v4[grade_v4]["wins"] += 1
 
-            # Get champion's point-in-time career stats for FP projection
-            champ_pit_stats = store.get_career_stats_before_date(my_token, match_date)
-            proj_fp = calc_projected_fp(
-                champ_pit_stats["career_elims"],
-                champ_pit_stats["career_deps"],
-                champ_pit_stats["career_wart"],
-                score_rounded,
+            # Champion's point-in-time career stats, for the deferred FP
+            # projection (it needs the batch-computed V3.3 score)
+            pit_stats_rows.append(
+                pit.get_career_stats_before_date(my_token, match_date)
             )
 
             # Get champion's actual performance from this match
@@ -186,41 +197,10 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
                     break
 
             actual_fp = calc_actual_fp(actual_elims, actual_deps, actual_wart, won)
-            fp_diff = round(actual_fp - proj_fp, 1)
-
-            # Track FP totals for summary
-            fp_totals["proj_sum"] += proj_fp
-            fp_totals["actual_sum"] += actual_fp
-            fp_totals["count"] += 1
-
-            # Build supporter info with point-in-time stats
-            my_supporters_info = []
-            for i, s in enumerate(supporters[my_team]):
-                if s.get("token_id"):
-                    stats = my_supp_stats[i] if i < len(my_supp_stats) else {}
-                    my_supporters_info.append({
-                        "token_id": s.get("token_id"),
-                        "name": s.get("name", ""),
-                        "class": s.get("class", ""),
-                        "career_elims": round(stats.get("career_elims", 1.0), 2),
-                        "career_deps": round(stats.get("career_deps", 1.5), 2),
-                        "career_wart": round(stats.get("career_wart", 0), 1),
-                        "win_rate": store.get_moki_winrate_before_date(s.get("token_id"), match_date),
-                    })
 
-            opp_supporters_info = []
-            for i, s in enumerate(supporters[opp_team]):
-                if s.get("token_id"):
-                    stats = opp_supp_stats[i] if i < len(opp_supp_stats) else {}
-                    opp_supporters_info.append({
-                        "token_id": s.get("token_id"),
-                        "name": s.get("name", ""),
-                        "class": s.get("class", ""),
-                        "career_elims": round(stats.get("career_elims", 1.0), 2),
-                        "career_deps": round(stats.get("career_deps", 1.5), 2),
-                        "career_wart": round(stats.get("career_wart", 0), 1),
-                        "win_rate": store.get_moki_winrate_before_date(s.get("token_id"), match_date),
-                    })
+            # Supporter info with point-in-time stats (shared per team)
+            my_supporters_info = team_supp_info[my_team]
+            opp_supporters_info = team_supp_info[opp_team]
 
             games.append(
                 {
@@ -230,9 +210,9 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
                     "champion_class": my_class,
                     "opponent": opp_champ.get("name", ""),
                     "opponent_class": opp_class,
-                    "matchup_score": score_rounded,  # V3.3 score
+                    "matchup_score": 0,  # V3.3 score, filled after batch scoring
                     "matchup_score_v4": score_v4,  # V4 composition score
-                    "grade": grade,  # V3.3 grade
+                    "grade": "",  # V3.3 grade, filled after batch scoring
                     "grade_v4": grade_v4,  # V4 grade
                     "my_pattern": my_pattern,  # Team composition pattern
                     "opp_pattern": opp_pattern,  # Opponent composition pattern
@@ -240,12 +220,67 @@ async def get_historical_analysis(limit: int = 50000) -> dict:
                     "win_type": match.win_type,
                     "my_supporters": my_supporters_info,
                     "opp_supporters": opp_supporters_info,
-                    "proj_fp": proj_fp,
+                    "proj_fp": 0,  # Filled after batch scoring
                     "actual_fp": actual_fp,
-                    "fp_diff": fp_diff,
+                    "fp_diff": 0,  # Filled after batch scoring
                 }
             )
 
+    # Batch V3.3 scoring over the gathered columns, then fill in the
+    # score-dependent fields, grade buckets, and FP totals per game
+    if col_wr:
+        scores = calc_matchup_score_vec(
+            np.array(col_wr, dtype=np.float64),
+            np.array(col_class_mu, dtype=np.float64),
+            np.array(col_my_elims, dtype=np.float64),
+            np.array(col_my_deps, dtype=np.float64),
+            np.array(col_opp_elims, dtype=np.float64),
+            np.array(col_opp_deps, dtype=np.float64),
+            np.array(col_elim_w, dtype=np.float64),
+            np.array(col_dep_w, dtype=np.float64),
+            np.array(col_opp_gacha, dtype=bool),
+        ).tolist()
+    else:
+        scores = []
+
+    # Scalar tail of calc_matchup_score (see calc_matchup_score_vec), then
+    # V3.3 grades and bucket totals via digitize/bincount instead of an
+    # if/elif chain and two dict updates per row
+    score_finals = [max(25, min(75, round(s, 1))) for s in scores]
+    grade_idx = np.digitize(np.array(score_finals, dtype=np.float64), _GRADE_EDGES)
+    won_flags = np.fromiter(
+        (game["result"] == "W" for game in games), dtype=bool, count=len(games)
+    )
+    grade_totals = np.bincount(grade_idx, minlength=5).tolist()
+    grade_wins = np.bincount(grade_idx[won_flags], minlength=5).tolist()
+    for name, total, wins in zip(_GRADE_NAMES, grade_totals, grade_wins):
+        grade_buckets[name]["total"] = total
+        grade_buckets[name]["wins"] = wins
+
+    for i, (game, champ_pit_stats) in enumerate(zip(games, pit_stats_rows)):
+        score = score_finals[i]
+        score_rounded = round(score, 1)
+        grade = _GRADE_NAMES[grade_idx[i]]
+
+        proj_fp = calc_projected_fp(
+            champ_pit_stats["career_elims"],
+            champ_pit_stats["career_deps"],
+            champ_pit_stats["career_wart"],
+            score_rounded,
+        )
+        actual_fp = game["actual_fp"]
+        fp_diff = round(actual_fp - proj_fp, 1)
+
+        # Track FP totals for summary
+        fp_totals["proj_sum"] += proj_fp
+        fp_totals["actual_sum"] += actual_fp
+        fp_totals["count"] += 1
+
+        game["matchup_score"] = score_rounded
+        game["grade"] = grade
+        game["proj_fp"] = proj_fp
+        game["fp_diff"] = fp_diff
+
     # Calculate bucket stats by grade (V3.3)
     bucket_stats = []
     for grade_name in ["A", "B", "C", "D", "F"]:
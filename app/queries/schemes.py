@@ -1,10 +1,20 @@
 """Scheme matching and champion trait analysis."""
 
 import json
+import re
 from pathlib import Path
 
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
 from .upcoming import get_upcoming_summary
 
+_CHAMPIONS_PATH = Path(__file__).parent.parent.parent / "champions.json"
+
 # Scheme trait requirements mapping (copied from database.py)
 SCHEME_TRAITS = {
     "Costume Party": {
@@ -45,46 +55,94 @@ SCHEME_TRAITS = {
 }
 
 
-def champion_matches_scheme(traits: list[str], scheme_name: str) -> bool:
-    """Check if a champion's traits match a scheme's requirements."""
-    if scheme_name not in SCHEME_TRAITS:
+def _compile_matchers() -> dict[str, tuple]:
+    """Precompile each scheme's rules into (contains_re, exclude_re, exact_set).
+
+    champion_matches_scheme runs champions x schemes times per request;
+    lowering the patterns and walking the rule lists on every call is pure
+    overhead, so the substring rules become alternation regexes and the
+    exact rules a frozenset, built once at import.
+    """
+    matchers = {}
+    for scheme_name, rules in SCHEME_TRAITS.items():
+        contains_re = (
+            re.compile("|".join(re.escape(p.lower()) for p in rules["contains"]))
+            if "contains" in rules
+            else None
+        )
+        exclude_re = (
+            re.compile("|".join(re.escape(e.lower()) for e in rules["exclude"]))
+            if "exclude" in rules
+            else None
+        )
+        exact_set = frozenset(t.lower() for t in rules.get("exact", []))
+        matchers[scheme_name] = (contains_re, exclude_re, exact_set)
+    return matchers
+
+
+_SCHEME_MATCHERS = _compile_matchers()
+
+
+def _build_trait_indexes() -> tuple[dict[str, list[str]], list[tuple]]:
+    """Invert SCHEME_TRAITS so lookups go trait -> schemes.
+
+    Exact rules become a dict keyed by normalized trait; the short list of
+    contains-substring rules stays a flat list scanned per champion. This
+    turns the champions x schemes matching loop into champions x traits
+    plus a handful of substring probes.
+    """
+    exact_index: dict[str, list[str]] = {}
+    contains_index: list[tuple] = []
+    for scheme_name, rules in SCHEME_TRAITS.items():
+        exclude_re = _SCHEME_MATCHERS[scheme_name][1]
+        for pattern in rules.get("contains", []):
+            contains_index.append((pattern.lower(), scheme_name, exclude_re))
+        for trait in rules.get("exact", []):
+            exact_index.setdefault(trait.lower(), []).append(scheme_name)
+    return exact_index, contains_index
+
+
+_EXACT_INDEX, _CONTAINS_INDEX = _build_trait_indexes()
+
+# champions.json rarely changes; cache the parsed list keyed by file mtime
+_champions_cache: tuple[float, list] = (0.0, [])
+
+
+def _load_champions() -> list[dict]:
+    """Load champions.json, reparsing only when the file changes on disk."""
+    global _champions_cache
+    mtime = _CHAMPIONS_PATH.stat().st_mtime
+    if mtime != _champions_cache[0]:
+        with open(_CHAMPIONS_PATH, "rb") as f:
+            raw = f.read()
+        champions = orjson.loads(raw) if _HAVE_ORJSON else json.loads(raw)
+        _champions_cache = (mtime, champions)
+    return _champions_cache[1]
+
+
+def _scheme_matches(scheme_name: str, traits_set: frozenset, traits_str: str) -> bool:
+    """Match pre-normalized traits against a precompiled scheme."""
+    matcher = _SCHEME_MATCHERS.get(scheme_name)
+    if matcher is None:
         return False
 
-    rules = SCHEME_TRAITS[scheme_name]
+    contains_re, exclude_re, exact_set = matcher
+    if contains_re and contains_re.search(traits_str):
+        if not (exclude_re and exclude_re.search(traits_str)):
+            return True
+    return not exact_set.isdisjoint(traits_set)
+
+
+def champion_matches_scheme(traits: list[str], scheme_name: str) -> bool:
+    """Check if a champion's traits match a scheme's requirements."""
     traits_lower = [t.lower() for t in traits]
-    traits_str = " ".join(traits_lower)
-
-    # Check "contains" rules (partial match)
-    if "contains" in rules:
-        for pattern in rules["contains"]:
-            if pattern.lower() in traits_str:
-                # Check exclusions
-                if "exclude" in rules:
-                    excluded = False
-                    for excl in rules["exclude"]:
-                        if excl.lower() in traits_str:
-                            excluded = True
-                            break
-                    if not excluded:
-                        return True
-                else:
-                    return True
-
-    # Check "exact" rules (exact trait match)
-    if "exact" in rules:
-        for exact_trait in rules["exact"]:
-            if exact_trait.lower() in traits_lower:
-                return True
-
-    return False
+    return _scheme_matches(scheme_name, frozenset(traits_lower), " ".join(traits_lower))
 
 
 async def get_schemes_data() -> dict:
     """Get champions with their matching schemes and avg MS."""
-    # Load champions data from local file
-    champions_path = Path(__file__).parent.parent.parent / "champions.json"
-    with open(champions_path, "r") as f:
-        champions = json.load(f)
+    # Load champions data from local file (parsed once, mtime-cached)
+    champions = _load_champions()
 
     # Get upcoming summary for MS data
     upcoming = await get_upcoming_summary()
@@ -98,11 +156,20 @@ async def get_schemes_data() -> dict:
         token_id = champ["id"]
         traits = champ["traits"]
 
-        # Find matching schemes
-        matching_schemes = []
-        for scheme_name in scheme_names:
-            if champion_matches_scheme(traits, scheme_name):
-                matching_schemes.append(scheme_name)
+        # Find matching schemes via the inverted trait indexes
+        traits_lower = [t.lower() for t in traits]
+        traits_str = " ".join(traits_lower)
+
+        hits: set[str] = set()
+        for trait in traits_lower:
+            hits.update(_EXACT_INDEX.get(trait, ()))
+        for pattern, scheme_name, exclude_re in _CONTAINS_INDEX:
+            if scheme_name not in hits and pattern in traits_str:
+                if not (exclude_re and exclude_re.search(traits_str)):
+                    hits.add(scheme_name)
+
+        # Preserve the scheme definition order in the output
+        matching_schemes = [name for name in scheme_names if name in hits]
 
         # Get MS data if available
         upcoming_data = upcoming_by_id.get(token_id)
@@ -1,14 +1,71 @@
 """Get upcoming matches summary - reimplemented for feed data store."""
 
+import hashlib
+import json
+from array import array
 from collections import defaultdict, Counter
+from pathlib import Path
+
+import numpy as np
 
 from ..feed import get_feed
-from .scoring import calc_matchup_score, get_grade
+from .scoring import CLASS_WEIGHTS, GACHA_CLASSES, calc_matchup_score_vec, get_grade
 from .scoring_v4 import calc_composition_score
 from .composition import detect_team_composition
 from .fantasy import calc_projected_fp
 from .blocks import get_utc_today, get_current_block, assign_blocks_to_all_matches
 
+# Memoized summaries per block_filter, valid for one (store version, day,
+# block) combination at a time - recomputed when the feed ingests new data
+# or the active block rolls over
+_summary_cache: dict = {}
+_summary_cache_stamp: tuple = None
+
+# Disk copy of the summary so the first request after a restart skips the
+# full recompute (same cache dir and best-effort style as analyze_strategy)
+_SUMMARY_CACHE_DIR = Path.home() / ".cache" / "contesttool"
+
+
+def _summary_cache_path(store, today: str, block: int, block_filter) -> Path:
+    """Cache filename keyed by the loaded match set and time context."""
+    digest = hashlib.sha1("\n".join(sorted(store.matches)).encode()).hexdigest()
+    return _SUMMARY_CACHE_DIR / (
+        f"upcoming_v1_{digest[:16]}_{today}_b{block}_f{block_filter or 0}.json"
+    )
+
+
+def _load_summary(path: Path) -> list | None:
+    """Load a cached summary from disk, or None if absent/unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_summary(path: Path, results: list):
+    """Persist the summary; best-effort, drops stale siblings.
+
+    Only files from an older (digest, day, block) stamp are removed: the
+    block_filter variants of the current stamp are all live at once (the
+    frontend requests both the unfiltered and the filtered summaries), so
+    they must coexist on disk.
+    """
+    try:
+        _SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        stamp_prefix = path.name.rsplit("_f", 1)[0] + "_f"
+        for stale in _SUMMARY_CACHE_DIR.glob("upcoming_*.json"):
+            if not stale.name.startswith(stamp_prefix):
+                stale.unlink(missing_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(results, f)
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
 
 async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
     """Get all champions with their aggregated matchup scores for upcoming games.
@@ -16,22 +73,58 @@ async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
     Args:
         block_filter: Optional block number (1, 2, or 3) to filter stats to only that block.
     """
+    global _summary_cache_stamp
     feed = await get_feed()
     store = feed.store
 
     # Filter to active games only (today and future)
     today = get_utc_today()
+
+    # Serve from cache unless the data version or time context moved on
+    stamp = (id(store), store.version, today, get_current_block())
+    if stamp != _summary_cache_stamp:
+        _summary_cache.clear()
+        _summary_cache_stamp = stamp
+    elif block_filter in _summary_cache:
+        return _summary_cache[block_filter]
+
+    # On a memory miss (fresh process or new data), check the disk artifact
+    cache_path = _summary_cache_path(store, today, get_current_block(), block_filter)
+    cached = _load_summary(cache_path)
+    if cached is not None:
+        _summary_cache[block_filter] = cached
+        return cached
+
     active_matches = store.get_active_scheduled_matches(today)
 
     # Build block assignments for ALL scheduled matches (across all dates)
     block_assignments = assign_blocks_to_all_matches(store)
     current_block = get_current_block()
 
-    champ_scores: dict[int, list[float]] = defaultdict(list)
-    champ_scores_v4: dict[int, list[float]] = defaultdict(list)  # V4 composition scores
+    # Flat per-row score columns with champions factorized to dense indexes
+    # in first-seen order; per-champion sums come from np.bincount below
+    # array.array buffers store unboxed C doubles/ints, so the thousands of
+    # per-row appends skip PyFloat allocation and convert to numpy for free
+    # via the buffer protocol
+    token_index: dict[int, int] = {}
+    row_tokens = array("q")
+    row_scores_v4 = array("d")
+    row_fp = array("d")
+    row_blocks = array("q")  # Block number per game row
+
+    # V3.3 score inputs gathered as SoA columns and batch-scored after the
+    # scan (same deferred-scoring shape as get_historical_analysis)
+    col_wr = array("d")
+    col_class_mu = array("d")
+    col_my_elims = array("d")
+    col_my_deps = array("d")
+    col_opp_elims = array("d")
+    col_opp_deps = array("d")
+    col_elim_w = array("d")
+    col_dep_w = array("d")
+    col_opp_gacha = array("b")
+
     champ_patterns: dict[int, list[str]] = defaultdict(list)  # Team patterns
-    champ_fp: dict[int, list[float]] = defaultdict(list)  # FP projections per game
-    champ_blocks: dict[int, list[int]] = defaultdict(list)  # Block numbers per game
     champ_info: dict[int, dict] = {}
     champ_latest_match: dict[int, str] = {}  # Track latest match_id for class display
 
@@ -109,19 +202,19 @@ async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
                 else 1.5
             )
 
-            # V3.3 score (legacy)
-            score = calc_matchup_score(
-                base_wr,
-                class_matchup,
-                my_avg_elims,
-                my_avg_deps,
-                opp_avg_elims,
-                opp_avg_deps,
-                my_class,
-                opp_class,
-            )
+            # V3.3 score inputs (legacy) - batch-scored after the scan
+            elim_w, dep_w = CLASS_WEIGHTS.get(my_class, (12, -4))
+            col_wr.append(base_wr)
+            col_class_mu.append(class_matchup)
+            col_my_elims.append(my_avg_elims)
+            col_my_deps.append(my_avg_deps)
+            col_opp_elims.append(opp_avg_elims)
+            col_opp_deps.append(opp_avg_deps)
+            col_elim_w.append(elim_w)
+            col_dep_w.append(dep_w)
+            col_opp_gacha.append(opp_class in GACHA_CLASSES)
 
-            champ_scores[token_id].append(score)
+            row_tokens.append(token_index.setdefault(token_id, len(token_index)))
 
             # V4 composition-based score
             score_v4, grade_v4, factors = calc_composition_score(
@@ -132,7 +225,7 @@ async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
                 my_class=my_class,
                 opp_class=opp_class,
             )
-            champ_scores_v4[token_id].append(score_v4)
+            row_scores_v4.append(score_v4)
             champ_patterns[token_id].append(factors.get("my_pattern", "BALANCED"))
 
             # Calculate projected fantasy points using CHAMPION's career stats
@@ -144,10 +237,10 @@ async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
                 champ_stats["career_wart"],
                 score_v4,  # Use V4 composition score
             )
-            champ_fp[token_id].append(proj_fp)
+            row_fp.append(proj_fp)
 
             # Track block for this game (already computed above)
-            champ_blocks[token_id].append(block)
+            row_blocks.append(block)
 
             # Update champ_info with latest match's class (higher match_id = newer)
             if token_id not in champ_info or match_id > champ_latest_match.get(token_id, ""):
@@ -159,50 +252,96 @@ async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
                 }
                 champ_latest_match[token_id] = match_id
 
+    # Batch V3.3 scoring over the gathered columns, with the scalar tail of
+    # calc_matchup_score applied per row (see calc_matchup_score_vec)
+    if col_wr:
+        raw_scores = calc_matchup_score_vec(
+            np.array(col_wr, dtype=np.float64),
+            np.array(col_class_mu, dtype=np.float64),
+            np.array(col_my_elims, dtype=np.float64),
+            np.array(col_my_deps, dtype=np.float64),
+            np.array(col_opp_elims, dtype=np.float64),
+            np.array(col_opp_deps, dtype=np.float64),
+            np.array(col_elim_w, dtype=np.float64),
+            np.array(col_dep_w, dtype=np.float64),
+            np.array(col_opp_gacha, dtype=bool),
+        ).tolist()
+    else:
+        raw_scores = []
+    row_scores_v3 = [max(25, min(75, round(s, 1))) for s in raw_scores]
+
+    # Per-champion sums via bincount over the dense indexes; .tolist() hands
+    # back plain Python numbers for the response payload
+    n_champs = len(token_index)
+    inv = np.array(row_tokens, dtype=np.intp)
+    v4_arr = np.array(row_scores_v4, dtype=np.float64)
+    game_counts = np.bincount(inv, minlength=n_champs).tolist()
+    v3_sums = np.bincount(
+        inv, weights=np.array(row_scores_v3, dtype=np.float64), minlength=n_champs
+    ).tolist()
+    v4_sums = np.bincount(inv, weights=v4_arr, minlength=n_champs).tolist()
+    expected_win_sums = np.bincount(
+        inv, weights=v4_arr / 100, minlength=n_champs
+    ).tolist()
+    fp_sums = np.bincount(
+        inv, weights=np.array(row_fp, dtype=np.float64), minlength=n_champs
+    ).tolist()
+    # Grade counts (V4): A >= 70, B >= 60, D in [40, 50), F < 40
+    a_counts = np.bincount(inv[v4_arr >= 70], minlength=n_champs).tolist()
+    b_counts = np.bincount(
+        inv[(v4_arr >= 60) & (v4_arr < 70)], minlength=n_champs
+    ).tolist()
+    d_counts = np.bincount(
+        inv[(v4_arr >= 40) & (v4_arr < 50)], minlength=n_champs
+    ).tolist()
+    f_counts = np.bincount(inv[v4_arr < 40], minlength=n_champs).tolist()
+    # Per-champion games in each contest block
+    blocks_arr = np.array(row_blocks, dtype=np.intp)
+    block_game_counts = {
+        b: np.bincount(inv[blocks_arr == b], minlength=n_champs).tolist()
+        for b in (1, 2, 3)
+    }
+
     # Build final results
     results = []
-    for token_id, scores in champ_scores.items():
+    for token_id, idx in token_index.items():
         info = champ_info[token_id]
-        scores_v4 = champ_scores_v4[token_id]
+        games = game_counts[idx]
         patterns = champ_patterns[token_id]
 
         # Use V4 scores for primary metrics
-        expected_wins = sum(s / 100 for s in scores_v4)
-        fp_list = champ_fp[token_id]
-        total_fp = sum(fp_list)
-        avg_fp = total_fp / len(fp_list) if fp_list else 0
+        expected_wins = expected_win_sums[idx]
+        total_fp = fp_sums[idx]
+        avg_fp = total_fp / games if games else 0
 
         # Count games by grade (using V4 scores)
-        grades = [get_grade(s) for s in scores_v4]
-        grade_a = sum(1 for g in grades if g == "A")
-        grade_b = sum(1 for g in grades if g == "B")
-        grade_d = sum(1 for g in grades if g == "D")
-        grade_f = sum(1 for g in grades if g == "F")
+        grade_a = a_counts[idx]
+        grade_b = b_counts[idx]
+        grade_d = d_counts[idx]
+        grade_f = f_counts[idx]
 
         # Determine average grade (using V4)
-        avg_score_v4 = sum(scores_v4) / len(scores_v4) if scores_v4 else 50
+        avg_score_v4 = v4_sums[idx] / games if games else 50
         avg_grade = get_grade(avg_score_v4)
 
         # Also compute legacy v3.3 average for comparison
-        avg_score_v3 = sum(scores) / len(scores) if scores else 50
+        avg_score_v3 = v3_sums[idx] / games if games else 50
 
         # Find most common pattern
         pattern_counts = Counter(patterns)
         most_common_pattern = pattern_counts.most_common(1)[0][0] if patterns else "BALANCED"
 
-        # Count games by block
-        blocks = champ_blocks.get(token_id, [])
-        block_counts = Counter(blocks)
+        # Count games by block (aggregated above)
         games_by_block = {
-            "1": block_counts.get(1, 0),
-            "2": block_counts.get(2, 0),
-            "3": block_counts.get(3, 0),
+            "1": block_game_counts[1][idx],
+            "2": block_game_counts[2][idx],
+            "3": block_game_counts[3][idx],
         }
 
         results.append(
             {
                 **info,
-                "games": len(scores_v4),
+                "games": games,
                 "avg_score": round(avg_score_v4, 1),  # V4 score as primary
                 "avg_score_v3": round(avg_score_v3, 1),  # Legacy for comparison
                 "avg_grade": avg_grade,
@@ -222,4 +361,7 @@ async def get_upcoming_summary(block_filter: int = None) -> list[dict]:
             }
         )
 
-    return sorted(results, key=lambda x: x["expected_wins"], reverse=True)
+    results = sorted(results, key=lambda x: x["expected_wins"], reverse=True)
+    _summary_cache[block_filter] = results
+    _save_summary(cache_path, results)
+    return results